@@ -5,20 +5,30 @@ A comprehensive script to fetch and analyze your Hevy workout statistics with in
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import asyncio
+import hashlib
+import pickle
 import pandas as pd
+import numpy as np
 import argparse
 import os
+import re
 import sys
+import time
+import random
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
+from functools import cached_property, lru_cache
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AsyncExitStack
 from tabulate import tabulate
 from rep_rules import REP_RANGE
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.mime.base import MIMEBase
-from email import encoders
+from email.message import EmailMessage
 
 # Load environment variables from .env file if it exists
 try:
@@ -28,22 +38,71 @@ except ImportError:
     # dotenv not installed, skip
     pass
 
+# Faster JSON parsing for the events file when orjson is installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # OpenAI integration for AI-powered insights
+# Seconds to wait for a completion before giving up on that attempt
+OPENAI_TIMEOUT = float(os.getenv("OPENAI_TIMEOUT", "30"))
+OPENAI_MAX_ATTEMPTS = 4
+
+# Optional separate OpenAI-compatible server (e.g. a local Ollama model) for the cheap-tier prompts only;
+# the primary prompts keep using the main OpenAI client
+AI_CHEAP_BASE_URL = os.getenv("HEVY_CHEAP_BASE_URL")
+AI_CHEAP_API_KEY = os.getenv("HEVY_CHEAP_API_KEY")
+
 try:
-    from openai import OpenAI
+    from openai import OpenAI, AsyncOpenAI
+    from openai import APIConnectionError, APITimeoutError, InternalServerError, RateLimitError
+    import httpx
     OPENAI_AVAILABLE = True
+    OPENAI_RETRYABLE_ERRORS = (RateLimitError, APITimeoutError, APIConnectionError, InternalServerError)
+    OPENAI_HTTP_TIMEOUT = httpx.Timeout(OPENAI_TIMEOUT, connect=5.0)
     
-    # Set up OpenAI client
+    # Set up OpenAI client (retries are handled by AICoach so they can be bounded and logged)
     openai_api_key = os.getenv("OPENAI_API_KEY")
     if openai_api_key:
-        openai_client = OpenAI(api_key=openai_api_key)
+        openai_client = OpenAI(api_key=openai_api_key, timeout=OPENAI_HTTP_TIMEOUT, max_retries=0)
+        cheap_openai_client = OpenAI(
+            base_url=AI_CHEAP_BASE_URL, api_key=AI_CHEAP_API_KEY or openai_api_key,
+            timeout=OPENAI_HTTP_TIMEOUT, max_retries=0
+        ) if AI_CHEAP_BASE_URL else None
     else:
         OPENAI_AVAILABLE = False
         openai_client = None
+        cheap_openai_client = None
 except ImportError:
     OPENAI_AVAILABLE = False
+    OPENAI_RETRYABLE_ERRORS = ()
+    OPENAI_HTTP_TIMEOUT = None
     openai_api_key = None
     openai_client = None
+    cheap_openai_client = None
+
+# Submit all AI coaching prompts as one Batch API job instead of one request each
+OPENAI_USE_BATCH = os.getenv("OPENAI_USE_BATCH", "false").lower() == "true"
+
+# Cheaper model for low-stakes prompts; sent to HEVY_CHEAP_BASE_URL when that is set
+AI_CHEAP_MODEL = os.getenv("HEVY_CHEAP_MODEL", "gpt-4o-mini")
+AI_CHEAP_PROMPTS = {"next_session_focus", "recovery_insights"}
+# Optional OpenAI service tier (e.g. "flex" on models that support it) for the primary model
+OPENAI_SERVICE_TIER = os.getenv("OPENAI_SERVICE_TIER")
+
+# Identical AI coaching prompts are answered from this cache instead of the API
+AI_CACHE_ENABLED = os.getenv("HEVY_AI_CACHE", "true").lower() != "false"
+AI_CACHE_DIR = os.path.expanduser(os.getenv("HEVY_AI_CACHE_DIR", "~/.cache/hevy_coach/openai"))
+AI_CACHE_TTL = 30 * 24 * 3600  # seconds; prompts carry day-dependent data, so old entries stop matching
+_ai_response_cache: Dict[str, str] = {}  # in-process tier, shared by every AICoach
+
+# Report analyses are reused for byte-identical workout data (and unchanged code/rep rules).
+# Entries are pickles, so the directory must only be writable by trusted users.
+ANALYSIS_CACHE_ENABLED = os.getenv("HEVY_ANALYSIS_CACHE", "true").lower() != "false"
+ANALYSIS_CACHE_DIR = os.path.expanduser(os.getenv("HEVY_ANALYSIS_CACHE_DIR", "~/.cache/hevy_coach/analysis"))
+ANALYSIS_CACHE_TTL = 7 * 24 * 3600  # seconds; the 90-day window makes every day's data a new entry
 
 # RPE-based coaching guidelines
 RPE_GUIDELINES = {
@@ -53,6 +112,104 @@ RPE_GUIDELINES = {
     "decrease_factor": 0.95,       # 5% weight decrease
 }
 
+# Status ladders, classified with np.searchsorted(bins, value): the index of the
+# first bin >= value selects the label, so each bin is an inclusive upper bound.
+RECOVERY_BINS = np.array([1, 2, 4, 7])  # days since last workout
+RECOVERY_LABELS = np.array([
+    "🔥 High frequency", "⚡ Good frequency", "✅ Optimal recovery", "😴 Extended rest", "🚨 Long break"
+], dtype=object)
+
+GROWTH_BINS = np.array([-1.0, -0.3, 0.3, 1.0])  # kg/week per exercise
+GROWTH_LABELS = np.array([
+    "⚠️ Significant Decline", "📉 Slight Decline", "🔄 Maintaining", "📈 Steady Growth", "💪 Strong Growth"
+], dtype=object)
+
+VOLUME_TREND_BINS = np.array([-500, -200, 200, 500])  # kg/week slope over recent weeks
+VOLUME_TREND_LABELS = np.array([
+    "rapidly declining", "declining", "stable", "steadily increasing", "rapidly increasing"
+], dtype=object)
+
+TRAJECTORY_BINS = np.array([-0.1, 0.1, 0.3])  # average kg/week across exercises
+TRAJECTORY_LABELS = np.array([
+    ("📉 Declining Phase", "Consider deload, recovery focus, or program change"),
+    ("🔄 Maintenance Phase", "Stable performance, consider progressive overload"),
+    ("📈 Good Progress", "Steady improvements in most exercises"),
+    ("🚀 Excellent Progress", "Strong upward trend across multiple exercises"),
+], dtype=object)
+
+PEAK_GAP_BINS = np.array([2, 5, 10])  # % below peak weight
+
+# Past tense of each recommended action, for missed-opportunity messages
+PAST_TENSE_ACTIONS = {"maintain": "maintained", "increase": "increased", "decrease": "decreased"}
+
+# Static AI coaching instructions. They are sent as the system prompt (a stable,
+# cacheable prefix) while each request's user message carries only compact JSON data.
+AI_SYSTEM_PROMPTS = {
+    "session_summary": (
+        "You are an expert strength coach with 10+ years of experience. Given JSON metrics for the athlete's "
+        "latest session (grade, score out of 100, exercises progressed/smart_adjustments/regressed, "
+        "adjustments_needed, overall trajectory, kg_per_week, sessions_per_week, top priority exercise), "
+        "write a personalized summary in 2-3 sentences: encouraging but honest, focused on the most important "
+        "takeaway, motivational yet technical, with specific next steps and at most 1-2 fitness emojis."
+    ),
+    "next_session_focus": (
+        "You are a practical strength coach. Given JSON lists of challenging (RPE 9.5+), form_focus and "
+        "confidence_builders (RPE 7 or lower) exercises from the last session, give 1-2 specific, actionable "
+        "focus points for the next session."
+    ),
+    "exercise_insights": (
+        "You are a technical strength coach. For each exercise in the JSON list (verdict, peak RPE, kg, reps), "
+        "give ONE practical tip of at most 1 sentence: why it happened (RPE context, technique, programming) "
+        "and what to do next session. Answer one line per exercise formatted \"Exercise: insight\", e.g. "
+        "\"Bench Press: RPE 9.5+ indicates weight too high - focus on controlled reps with 5kg less next session\"."
+    ),
+    "trend_analysis": (
+        "You are a strategic strength coach who analyzes training patterns to optimize long-term progress. "
+        "Given JSON training trends, say in 2-3 specific, actionable sentences what they reveal about training "
+        "effectiveness, one key program recommendation, and any warning signs or positive indicators."
+    ),
+    "next_day_overview": (
+        "You are a comprehensive strength coach planning the next training session. Given JSON session context, "
+        "give 3-4 specific, motivational points covering pre-workout preparation (warm-up focus, mindset), key "
+        "execution priorities (RPE targets, form cues) and post-workout cool-down and recovery."
+    ),
+    "rest_day_overview": (
+        "You are a comprehensive strength coach planning a rest day. Given JSON recovery context, give 3-4 "
+        "specific, encouraging points covering recovery priorities (sleep, nutrition, mobility), light activity "
+        "and mental preparation for the next training session."
+    ),
+    "combined_report": (
+        "You are an expert strength coach writing several sections of one coaching report. The user message "
+        "maps each section name to its JSON data. Reply with a JSON object holding one plain-text string per "
+        "section, written as these instructions describe:"
+    ),
+    "recovery_insights": (
+        "You are a recovery specialist coach focused on optimizing training adaptations through smart recovery. "
+        "Given JSON recovery metrics, give 1-2 specific recommendations in at most 2 sentences covering "
+        "sleep/nutrition priorities, active recovery and signs of overtraining or under-recovery."
+    ),
+}
+
+ASSISTED_KEYWORDS = (
+    "assisted", "assist", "band assisted", "machine assisted",
+    "counterweight", "counter weight", "help", "support"
+)
+ASSISTED_PATTERN = re.compile("|".join(re.escape(keyword) for keyword in ASSISTED_KEYWORDS))
+
+# Workout titles (lowercased) that mark a rest or cardio-only day
+REST_DAY_PATTERN = re.compile("rest|treadmill|cardio|recovery")
+
+# RPE progression policy keyed by (rpe_band, is_assisted) -> (action, sign, pct, reasoning template)
+RPE_POLICY = {
+    ("low", False): ("increase", 1, 0.025, "RPE {rpe} indicates room for progression (+{delta:.1f}kg)"),
+    ("low", True): ("decrease", -1, 0.025, "RPE {rpe} too low, reduce assistance by {delta:.1f}kg to make it harder"),
+    ("high", False): ("decrease", -1, 0.05, "RPE {rpe} too high, reduce by {delta:.1f}kg for better form"),
+    ("high", True): ("increase", 1, 0.05, "RPE {rpe} too high, increase assistance by {delta:.1f}kg for better form"),
+}
+RPE_MAINTAIN_REASONING = "RPE {rpe} is in good range - maintain current weight"
+RPE_MIN_DELTA_KG = 2.5  # smallest weight adjustment the policy suggests
+
+@lru_cache(maxsize=2048)
 def is_assisted_exercise(exercise_name: str) -> bool:
     """
     Check if an exercise is an assisted exercise where higher weight = easier.
@@ -63,25 +220,167 @@ def is_assisted_exercise(exercise_name: str) -> bool:
     Returns:
         True if this is an assisted exercise
     """
-    assisted_keywords = [
-        "assisted", "assist", "band assisted", "machine assisted",
-        "counterweight", "counter weight", "help", "support"
-    ]
-    
-    exercise_lower = exercise_name.lower()
-    return any(keyword in exercise_lower for keyword in assisted_keywords)
+    return ASSISTED_PATTERN.search(exercise_name.lower()) is not None
 
 class AICoach:
     """AI-powered coaching insights using GPT-4o-mini."""
     
-    def __init__(self):
+    def __init__(self, use_cache: bool = True):
         self.available = OPENAI_AVAILABLE and openai_api_key and openai_client is not None
         self.model = "gpt-4o-mini"  # Cost-effective model for coaching insights
+        self.model_tiers = {"primary": self.model, "cheap": AI_CHEAP_MODEL}
+        self.use_batch = OPENAI_USE_BATCH
+        self._prefetched = {}  # custom_id -> completion text from prefetch_report_insights()
+        self.use_cache = use_cache and AI_CACHE_ENABLED
+        self._cache_pruned = False
         
     def is_available(self) -> bool:
         """Check if AI coaching is available."""
         return self.available
     
+    def _cache_path(self, request: Dict) -> str:
+        """Content-addressed cache file for a chat completion request."""
+        key = hashlib.sha256(json.dumps(request, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+        return os.path.join(AI_CACHE_DIR, key[:2], key)
+    
+    def _cached_completion(self, request: Dict) -> Optional[str]:
+        """Look up a previous completion for a byte-identical request."""
+        if not self.use_cache:
+            return None
+        
+        path = self._cache_path(request)
+        if path not in _ai_response_cache:
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    _ai_response_cache[path] = f.read()
+            except OSError:
+                return None
+        return _ai_response_cache[path]
+    
+    def _store_completion(self, request: Dict, text: str):
+        """Remember a completion in memory and on disk (best effort)."""
+        if not self.use_cache:
+            return
+        
+        path = self._cache_path(request)
+        _ai_response_cache[path] = text
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(text)
+        except OSError:
+            pass
+        
+        # Expire stale entries once per coach, on its first write
+        if not self._cache_pruned:
+            _prune_cache_dir(AI_CACHE_DIR, AI_CACHE_TTL)
+            self._cache_pruned = True
+    
+    def _chat(self, custom_id: str, request: Dict) -> str:
+        """Return the completion for a request, preferring prefetched and cached results."""
+        if custom_id in self._prefetched:
+            return self._prefetched[custom_id]
+        
+        cached = self._cached_completion(request)
+        if cached is not None:
+            return cached
+        
+        client = cheap_openai_client if self._uses_cheap_server(custom_id) else openai_client
+        response = self._call_with_retry(request, client)
+        text = response.choices[0].message.content.strip()
+        self._store_completion(request, text)
+        return text
+    
+    def _uses_cheap_server(self, custom_id: str) -> bool:
+        """Whether a prompt goes to the separate cheap-tier server (only when HEVY_CHEAP_BASE_URL is set)."""
+        return bool(AI_CHEAP_BASE_URL) and custom_id in AI_CHEAP_PROMPTS
+    
+    def _progress(self, message: Optional[str]):
+        """Show a one-line progress message on an interactive stderr (None clears it)."""
+        if not sys.stderr.isatty():
+            return
+        sys.stderr.write(f"\r\033[K🤖 {message}" if message else "\r\033[K")
+        sys.stderr.flush()
+    
+    def _retry_delay(self, attempt: int, error: Exception) -> float:
+        """Seconds to wait before retrying: the server's Retry-After if given, else jittered backoff."""
+        response = getattr(error, "response", None)
+        if response is not None:
+            try:
+                return float(response.headers.get("retry-after"))
+            except (TypeError, ValueError):
+                pass
+        return 0.5 * 2 ** attempt + random.random() * 0.25
+    
+    def _call_with_retry(self, request: Dict, client=None):
+        """Create a chat completion, retrying rate limits, timeouts and server errors."""
+        client = client or openai_client
+        for attempt in range(OPENAI_MAX_ATTEMPTS):
+            try:
+                return client.chat.completions.create(**request)
+            except OPENAI_RETRYABLE_ERRORS as e:
+                if attempt == OPENAI_MAX_ATTEMPTS - 1:
+                    raise
+                time.sleep(self._retry_delay(attempt, e))
+    
+    async def _acall_with_retry(self, client, request: Dict):
+        """Async counterpart of _call_with_retry."""
+        for attempt in range(OPENAI_MAX_ATTEMPTS):
+            try:
+                return await client.chat.completions.create(**request)
+            except OPENAI_RETRYABLE_ERRORS as e:
+                if attempt == OPENAI_MAX_ATTEMPTS - 1:
+                    raise
+                await asyncio.sleep(self._retry_delay(attempt, e))
+    
+    def _request(self, prompt_name: str, data, **params) -> Dict:
+        """Chat completion request: static coaching rules as the system prompt, data as compact JSON."""
+        tier = "cheap" if prompt_name in AI_CHEAP_PROMPTS else "primary"
+        if tier == "primary" and OPENAI_SERVICE_TIER:
+            params["service_tier"] = OPENAI_SERVICE_TIER
+        
+        return {
+            "model": self.model_tiers[tier],
+            "messages": [{
+                "role": "system",
+                "content": AI_SYSTEM_PROMPTS[prompt_name]
+            }, {
+                "role": "user",
+                "content": json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=str)
+            }],
+            **params
+        }
+    
+    def _session_summary_request(self, session_quality: Dict, last_session: Dict, 
+                                 comprehensive_trends: Dict) -> Dict:
+        """Build the chat completion request for generate_session_summary."""
+        # Count adjustments needed
+        adjustments_needed = 0
+        priority_exercises = []
+        if last_session and last_session.get("exercises"):
+            for ex in last_session["exercises"]:
+                if ex["verdict"] in ["⬇️ too heavy", "⬆️ too light"]:
+                    adjustments_needed += 1
+                    peak_rpe = ex.get("peak_rpe", 8.0)
+                    if peak_rpe:
+                        priority = abs(peak_rpe - 8.5)  # Distance from ideal RPE
+                        priority_exercises.append((priority, ex["name"], ex["verdict"]))
+            
+            priority_exercises.sort(reverse=True)  # Highest priority first
+        
+        return self._request("session_summary", {
+            "grade": session_quality.get("grade", "Unknown"),
+            "score": round(session_quality.get("overall_score", 0)),
+            "progressed": session_quality.get("progressed", 0),
+            "smart_adjustments": session_quality.get("smart_adjustments", 0),
+            "regressed": session_quality.get("regressed", 0),
+            "adjustments_needed": adjustments_needed,
+            "trajectory": comprehensive_trends.get("fitness_trajectory", "Unknown"),
+            "kg_per_week": round(comprehensive_trends.get("avg_progression_rate", 0), 1),
+            "sessions_per_week": round(comprehensive_trends.get("training_frequency", 0), 1),
+            "priority": f"{priority_exercises[0][1]}: {priority_exercises[0][2]}" if priority_exercises else None
+        }, max_tokens=500, temperature=0.7, top_p=0.9)
+    
     def generate_session_summary(self, session_quality: Dict, last_session: Dict, 
                                 comprehensive_trends: Dict, user_context: Dict = None) -> str:
         """
@@ -100,197 +399,107 @@ class AICoach:
             return None
             
         try:
-            # Prepare structured data for AI analysis
-            session_data = {
-                "grade": session_quality.get("grade", "Unknown"),
-                "overall_score": session_quality.get("overall_score", 0),
-                "description": session_quality.get("description", ""),
-                "progressed": session_quality.get("progressed", 0),
-                "smart_adjustments": session_quality.get("smart_adjustments", 0),
-                "regressed": session_quality.get("regressed", 0)
-            }
-            
-            # Count adjustments needed
-            adjustments_needed = 0
-            priority_exercises = []
-            if last_session and last_session.get("exercises"):
-                for ex in last_session["exercises"]:
-                    if ex["verdict"] in ["⬇️ too heavy", "⬆️ too light"]:
-                        adjustments_needed += 1
-                        peak_rpe = ex.get("peak_rpe", 8.0)
-                        if peak_rpe:
-                            priority = abs(peak_rpe - 8.5)  # Distance from ideal RPE
-                            priority_exercises.append((priority, ex["name"], ex["verdict"]))
-                
-                priority_exercises.sort(reverse=True)  # Highest priority first
-            
-            # Overall progress context
-            progress_data = {
-                "trajectory": comprehensive_trends.get("fitness_trajectory", "Unknown"),
-                "avg_rate": comprehensive_trends.get("avg_progression_rate", 0),
-                "frequency": comprehensive_trends.get("training_frequency", 0)
-            }
-            
-            # Create coaching prompt
-            prompt = f"""You are an expert strength coach providing personalized feedback. Analyze this workout session and provide encouraging, actionable insights.
-
-SESSION METRICS:
-- Grade: {session_data['grade']} ({session_data['overall_score']:.0f}/100)
-- Progress: {session_data['progressed']} exercises progressed, {session_data['smart_adjustments']} smart adjustments, {session_data['regressed']} regressed
-- Adjustments needed: {adjustments_needed} exercises need weight changes
-
-OVERALL PROGRESS:
-- Trajectory: {progress_data['trajectory']}
-- Average progression: {progress_data['avg_rate']:+.1f}kg/week
-- Training frequency: {progress_data['frequency']:.1f} sessions/week
-
-TOP PRIORITY EXERCISE:
-{priority_exercises[0][1] if priority_exercises else "None"}: {priority_exercises[0][2] if priority_exercises else "All exercises optimal"}
-
-COACHING STYLE:
-- Be encouraging but honest
-- Use 2-3 sentences maximum
-- Focus on the most important takeaway
-- Use motivational language but stay technical
-- Include specific next steps
-- Use fitness emojis sparingly (1-2 max)
-
-Provide a personalized summary that feels like it's from an experienced coach who knows the athlete."""
-
-            # Call OpenAI API
-            response = openai_client.chat.completions.create(
-                model=self.model,
-                messages=[{
-                    "role": "system",
-                    "content": "You are an expert strength coach with 10+ years of experience. You provide personalized, encouraging feedback that motivates athletes while keeping them focused on proper progression."
-                }, {
-                    "role": "user", 
-                    "content": prompt
-                }],
-                max_tokens=500,  # Keep it concise
-                temperature=0.7,  # Some creativity but stay factual
-                top_p=0.9
-            )
-            
-            return response.choices[0].message.content.strip()
+            return self._chat("session_summary", self._session_summary_request(
+                session_quality, last_session, comprehensive_trends
+            ))
             
         except Exception as e:
             print(f"⚠️ AI coaching unavailable: {e}")
             return None
     
+    def _next_session_focus_request(self, last_session: Dict) -> Optional[Dict]:
+        """Build the chat completion request for generate_next_session_focus."""
+        if not last_session:
+            return None
+        
+        # Analyze exercise-specific challenges
+        challenging_exercises = []
+        form_focus_exercises = []
+        confidence_builders = []
+        
+        for ex in last_session.get("exercises", []):
+            peak_rpe = ex.get("peak_rpe")
+            verdict = ex.get("verdict", "")
+            
+            if peak_rpe and peak_rpe >= 9.5:
+                challenging_exercises.append(ex["name"])
+            elif peak_rpe and peak_rpe <= 7.0:
+                confidence_builders.append(ex["name"])
+            elif verdict == "⬇️ too heavy":
+                form_focus_exercises.append(ex["name"])
+        
+        return self._request("next_session_focus", {
+            "challenging": challenging_exercises[:2],
+            "form_focus": form_focus_exercises[:2],
+            "confidence_builders": confidence_builders[:2]
+        }, max_tokens=1000, temperature=0.6)
+    
     def generate_next_session_focus(self, last_session: Dict, progression_data: Dict) -> str:
         """Generate AI-powered focus points for the next session."""
         if not self.available or not last_session:
             return None
             
         try:
-            # Analyze exercise-specific challenges
-            challenging_exercises = []
-            form_focus_exercises = []
-            confidence_builders = []
-            
-            for ex in last_session.get("exercises", []):
-                peak_rpe = ex.get("peak_rpe")
-                verdict = ex.get("verdict", "")
-                
-                if peak_rpe and peak_rpe >= 9.5:
-                    challenging_exercises.append(ex["name"])
-                elif peak_rpe and peak_rpe <= 7.0:
-                    confidence_builders.append(ex["name"])
-                elif verdict == "⬇️ too heavy":
-                    form_focus_exercises.append(ex["name"])
-            
-            prompt = f"""As a strength coach, provide 1-2 specific focus points for the next training session.
-
-CURRENT SESSION ANALYSIS:
-- Challenging exercises (RPE 9.5+): {', '.join(challenging_exercises[:2]) if challenging_exercises else 'None'}
-- Form focus needed: {', '.join(form_focus_exercises[:2]) if form_focus_exercises else 'None'}  
-- Confidence builders (RPE ≤7): {', '.join(confidence_builders[:2]) if confidence_builders else 'None'}
-
-Give practical, specific advice for the next session. Keep it to 1-2 actionable focus points maximum."""
-
-            response = openai_client.chat.completions.create(
-                model=self.model,
-                messages=[{
-                    "role": "system",
-                    "content": "You are a practical strength coach. Give specific, actionable advice."
-                }, {
-                    "role": "user",
-                    "content": prompt
-                }],
-                max_tokens=1000,
-                temperature=0.6
-            )
-            
-            return response.choices[0].message.content.strip()
+            return self._chat("next_session_focus", self._next_session_focus_request(last_session))
             
         except Exception as e:
             print(f"⚠️ AI focus generation unavailable: {e}")
             return None
 
+    def _insight_priority_exercises(self, exercise_data: List[Dict]) -> List[Dict]:
+        """Exercises (of the top 8) whose verdict calls for a weight change."""
+        priority_exercises = []
+        
+        for ex in exercise_data[:8]:  # Top 8 exercises
+            exercise_name = ex["name"]
+            verdict = ex.get("verdict", "")
+            peak_rpe = ex.get("peak_rpe")
+            
+            # Add exercises that need attention
+            if verdict in ["⬇️ too heavy", "⬆️ too light"]:
+                priority_exercises.append({
+                    "name": exercise_name,
+                    "verdict": verdict,
+                    "rpe": peak_rpe,
+                    "weight": ex.get("avg_weight", 0),
+                    "reps": ex.get("avg_reps", 0)
+                })
+        
+        return priority_exercises
+    
+    def _exercise_insights_request(self, exercise_data: List[Dict]) -> Optional[Dict]:
+        """Build the chat completion request for generate_exercise_insights."""
+        if not exercise_data:
+            return None
+        
+        # Focus on exercises that need adjustments or have interesting patterns
+        priority_exercises = self._insight_priority_exercises(exercise_data)
+        if not priority_exercises:
+            return None
+        
+        return self._request("exercise_insights", [{
+            "name": ex["name"],
+            "verdict": ex["verdict"],
+            "rpe": round(ex["rpe"], 1) if ex["rpe"] is not None else None,
+            "kg": round(ex["weight"], 1),
+            "reps": round(ex["reps"], 1)
+        } for ex in priority_exercises[:3]], max_tokens=1000, temperature=0.5)
+
     def generate_exercise_insights(self, exercise_data: List[Dict], progression_data: Dict) -> Dict:
         """Generate AI insights for specific exercises that need attention."""
         if not self.available or not exercise_data:
             return {}
             
         try:
-            # Focus on exercises that need adjustments or have interesting patterns
-            priority_exercises = []
-            
-            for ex in exercise_data[:8]:  # Top 8 exercises
-                exercise_name = ex["name"]
-                verdict = ex.get("verdict", "")
-                peak_rpe = ex.get("peak_rpe")
-                
-                # Add exercises that need attention
-                if verdict in ["⬇️ too heavy", "⬆️ too light"]:
-                    priority_exercises.append({
-                        "name": exercise_name,
-                        "verdict": verdict,
-                        "rpe": peak_rpe,
-                        "weight": ex.get("avg_weight", 0),
-                        "reps": ex.get("avg_reps", 0)
-                    })
-            
-            if not priority_exercises:
+            request = self._exercise_insights_request(exercise_data)
+            if not request:
                 return {}
             
-            # Create prompt for exercise-specific insights
-            exercise_lines = []
-            for ex in priority_exercises[:3]:
-                rpe_str = f"{ex['rpe']:.1f}" if ex['rpe'] is not None else "N/A"
-                exercise_lines.append(f"- {ex['name']}: {ex['verdict']}, RPE {rpe_str}, {ex['weight']:.1f}kg×{ex['reps']:.1f}")
-            exercise_list = "\n".join(exercise_lines)
-            
-            prompt = f"""As a strength coach, provide brief, specific insights for these exercises that need attention:
-
-{exercise_list}
-
-For each exercise, give ONE practical tip focusing on:
-- Why this happened (RPE context, technique, programming)
-- What to do next session
-- Keep each tip to 1 sentence maximum
-
-Format: "Exercise: insight"
-Example: "Bench Press: RPE 9.5+ indicates weight too high - focus on controlled reps with 5kg less next session"
-"""
-
-            response = openai_client.chat.completions.create(
-                model=self.model,
-                messages=[{
-                    "role": "system",
-                    "content": "You are a technical strength coach. Provide specific, actionable exercise advice."
-                }, {
-                    "role": "user",
-                    "content": prompt
-                }],
-                max_tokens=1000,
-                temperature=0.5
-            )
+            priority_exercises = self._insight_priority_exercises(exercise_data)
             
             # Parse the response into a dictionary
             insights = {}
-            response_text = response.choices[0].message.content.strip()
+            response_text = self._chat("exercise_insights", request)
             
             for line in response_text.split('\n'):
                 if ':' in line and any(ex['name'] in line for ex in priority_exercises):
@@ -307,64 +516,63 @@ Example: "Bench Press: RPE 9.5+ indicates weight too high - focus on controlled
             print(f"⚠️ AI exercise insights unavailable: {e}")
             return {}
 
+    def _trend_analysis_request(self, comprehensive_trends: Dict, periodization: Dict) -> Dict:
+        """Build the chat completion request for generate_trend_analysis."""
+        return self._request("trend_analysis", {
+            "trajectory": comprehensive_trends.get("fitness_trajectory", "Unknown"),
+            "kg_per_week": round(comprehensive_trends.get("avg_progression_rate", 0), 1),
+            "sessions_per_week": round(comprehensive_trends.get("training_frequency", 0), 1),
+            "program_status": periodization.get("program_status", "Unknown"),
+            "plateau_pct": round(periodization.get("plateau_percentage", 0)),
+            "progressing": len(periodization.get("progressing_exercises", [])),
+            "plateaued": len(periodization.get("plateaued_exercises", [])),
+            "smart_adjustments": len(periodization.get("smart_adjustments", []))
+        }, max_tokens=1000, temperature=0.6)
+
     def generate_trend_analysis(self, comprehensive_trends: Dict, periodization: Dict) -> str:
         """Generate AI analysis of overall trends and patterns."""
         if not self.available:
             return None
             
         try:
-            # Extract key trend data
-            trajectory = comprehensive_trends.get("fitness_trajectory", "Unknown")
-            avg_progression = comprehensive_trends.get("avg_progression_rate", 0)
-            frequency = comprehensive_trends.get("training_frequency", 0)
-            program_status = periodization.get("program_status", "Unknown")
-            plateau_pct = periodization.get("plateau_percentage", 0)
-            
-            # Count exercise categories
-            progressing = len(periodization.get("progressing_exercises", []))
-            plateaued = len(periodization.get("plateaued_exercises", []))
-            smart_adjustments = len(periodization.get("smart_adjustments", []))
-            
-            prompt = f"""As an experienced strength coach, analyze these training trends and provide strategic insights:
-
-OVERALL TRENDS:
-- Trajectory: {trajectory}
-- Average progression: {avg_progression:+.1f}kg/week
-- Training frequency: {frequency:.1f} sessions/week
-- Program status: {program_status}
-- Plateau rate: {plateau_pct:.0f}%
-
-EXERCISE BREAKDOWN:
-- Progressing: {progressing} exercises
-- Plateaued: {plateaued} exercises  
-- Smart adjustments: {smart_adjustments} exercises
-
-Provide 2-3 strategic insights about:
-1. What these trends reveal about training effectiveness
-2. One key recommendation for program optimization
-3. Any warning signs or positive indicators to note
-
-Keep response to 2-3 sentences maximum. Be specific and actionable."""
-
-            response = openai_client.chat.completions.create(
-                model=self.model,
-                messages=[{
-                    "role": "system",
-                    "content": "You are a strategic strength coach who analyzes training patterns to optimize long-term progress."
-                }, {
-                    "role": "user",
-                    "content": prompt
-                }],
-                max_tokens=1000,
-                temperature=0.6
-            )
-            
-            return response.choices[0].message.content.strip()
+            return self._chat("trend_analysis", self._trend_analysis_request(comprehensive_trends, periodization))
             
         except Exception as e:
             print(f"⚠️ AI trend analysis unavailable: {e}")
             return None
 
+    def _next_day_overview_request(self, last_session: Dict, next_workout_info: Dict, 
+                                   comprehensive_trends: Dict, volume_recovery: Dict) -> Dict:
+        """Build the chat completion request for generate_next_day_overview."""
+        # Overall trajectory
+        trajectory = comprehensive_trends.get("fitness_trajectory", "Unknown")
+        avg_progression = round(comprehensive_trends.get("avg_progression_rate", 0), 1)
+        recovery_status = volume_recovery.get("recovery_status", "Unknown")
+        
+        if next_workout_info.get("is_rest_day", False):
+            return self._request("rest_day_overview", {
+                "last_session": last_session.get("workout_title", "Unknown") if last_session else None,
+                "days_since_last": volume_recovery.get("days_since_last", 0),
+                "recovery_status": recovery_status,
+                "trajectory": trajectory,
+                "kg_per_week": avg_progression
+            }, max_tokens=1000, temperature=0.7)
+        
+        # Get adjustment count
+        adjustments_needed = 0
+        if last_session and last_session.get("exercises"):
+            for ex in last_session["exercises"]:
+                if ex["verdict"] in ["⬇️ too heavy", "⬆️ too light"]:
+                    adjustments_needed += 1
+        
+        return self._request("next_day_overview", {
+            "workout": next_workout_info.get("workout_name", "Unknown"),
+            "adjustments_needed": adjustments_needed,
+            "recovery_status": recovery_status,
+            "trajectory": trajectory,
+            "kg_per_week": avg_progression
+        }, max_tokens=1000, temperature=0.7)
+
     def generate_next_day_overview(self, last_session: Dict, next_workout_info: Dict, 
                                  comprehensive_trends: Dict, volume_recovery: Dict) -> str:
         """Generate comprehensive AI overview and recommendations for the next day."""
@@ -372,119 +580,294 @@ Keep response to 2-3 sentences maximum. Be specific and actionable."""
             return None
             
         try:
-            # Determine next session type
-            next_workout = next_workout_info.get("workout_name", "Unknown")
-            is_rest_day = next_workout_info.get("is_rest_day", False)
-            days_since_last = volume_recovery.get("days_since_last", 0)
-            recovery_status = volume_recovery.get("recovery_status", "Unknown")
-            
-            # Get adjustment count
-            adjustments_needed = 0
-            if last_session and last_session.get("exercises"):
-                for ex in last_session["exercises"]:
-                    if ex["verdict"] in ["⬇️ too heavy", "⬆️ too light"]:
-                        adjustments_needed += 1
-            
-            # Overall trajectory
-            trajectory = comprehensive_trends.get("fitness_trajectory", "Unknown")
-            avg_progression = comprehensive_trends.get("avg_progression_rate", 0)
-            
-            if is_rest_day:
-                prompt = f"""As a recovery specialist coach, provide a comprehensive rest day plan:
-
-RECOVERY CONTEXT:
-- Last session grade: {last_session.get('workout_title', 'Unknown') if last_session else 'No recent session'}
-- Days since last workout: {days_since_last}
-- Recovery status: {recovery_status}
-- Overall progress: {trajectory} ({avg_progression:+.1f}kg/week)
-
-Create a strategic rest day plan covering:
-1. Recovery priorities (sleep, nutrition, mobility)
-2. Light activity recommendations
-3. Mental preparation for next training session
-
-Keep to 3-4 actionable points. Be specific and encouraging."""
-            else:
-                prompt = f"""As a workout planning coach, create a comprehensive next session strategy:
-
-NEXT SESSION INFO:
-- Workout: {next_workout}
-- Adjustments needed: {adjustments_needed} exercises from last session
-- Recovery status: {recovery_status}
-- Overall progress: {trajectory} ({avg_progression:+.1f}kg/week)
-
-Create a strategic training day plan covering:
-1. Pre-workout preparation (warm-up focus, mindset)
-2. Key execution priorities (RPE targets, form cues)
-3. Post-workout optimization (cool-down, recovery)
-
-Keep to 3-4 actionable points. Be specific and motivational."""
-
-            response = openai_client.chat.completions.create(
-                model=self.model,
-                messages=[{
-                    "role": "system",
-                    "content": "You are a comprehensive strength coach who plans optimal training and recovery strategies."
-                }, {
-                    "role": "user",
-                    "content": prompt
-                }],
-                max_tokens=1000,
-                temperature=0.7
-            )
-            
-            return response.choices[0].message.content.strip()
+            return self._chat("next_day_overview", self._next_day_overview_request(
+                last_session, next_workout_info, comprehensive_trends, volume_recovery
+            ))
             
         except Exception as e:
             print(f"⚠️ AI next day overview unavailable: {e}")
             return None
 
+    def _recovery_insights_request(self, volume_recovery: Dict, comprehensive_trends: Dict) -> Dict:
+        """Build the chat completion request for generate_recovery_insights."""
+        return self._request("recovery_insights", {
+            "days_since_last": volume_recovery.get("days_since_last", 0),
+            "sessions_per_week": round(comprehensive_trends.get("training_frequency", 0), 1),
+            "volume_trend": volume_recovery.get("volume_trend", "stable"),
+            "recovery_status": volume_recovery.get("recovery_status", "Unknown")
+        }, max_tokens=500, temperature=0.6)
+
     def generate_recovery_insights(self, volume_recovery: Dict, comprehensive_trends: Dict) -> str:
         """Generate AI insights for recovery and preparation."""
         if not self.available:
             return None
             
         try:
-            # Extract recovery data
-            days_since_last = volume_recovery.get("days_since_last", 0)
-            frequency = comprehensive_trends.get("training_frequency", 0)
-            volume_trend = volume_recovery.get("volume_trend", "stable")
-            recovery_status = volume_recovery.get("recovery_status", "Unknown")
-            
-            prompt = f"""As a recovery specialist, analyze this training pattern and provide recovery insights:
-
-RECOVERY METRICS:
-- Days since last session: {days_since_last}
-- Training frequency: {frequency:.1f} sessions/week
-- Volume trend: {volume_trend}
-- Recovery status: {recovery_status}
-
-Provide 1-2 specific recovery recommendations focusing on:
-- Sleep/nutrition priorities
-- Active recovery suggestions
-- Signs to watch for overtraining/underrecovery
-
-Keep concise and actionable (2 sentences max)."""
-
-            response = openai_client.chat.completions.create(
-                model=self.model,
-                messages=[{
-                    "role": "system",
-                    "content": "You are a recovery specialist coach focused on optimizing training adaptations through smart recovery."
-                }, {
-                    "role": "user",
-                    "content": prompt
-                }],
-                max_tokens=500,
-                temperature=0.6
-            )
-            
-            return response.choices[0].message.content.strip()
+            return self._chat("recovery_insights", self._recovery_insights_request(volume_recovery, comprehensive_trends))
             
         except Exception as e:
             print(f"⚠️ AI recovery insights unavailable: {e}")
             return None
 
+    async def _gather_chats(self, requests_by_id: Dict[str, Dict]) -> Dict[str, str]:
+        """Send all requests at once over one pooled async client (plus one for a separate cheap-tier server)."""
+        http_client = httpx.AsyncClient(limits=httpx.Limits(max_keepalive_connections=8))
+        finished = 0
+        async with AsyncExitStack() as stack:
+            client = await stack.enter_async_context(AsyncOpenAI(
+                api_key=openai_api_key, http_client=http_client, timeout=OPENAI_HTTP_TIMEOUT, max_retries=0
+            ))
+            cheap_client = client
+            if AI_CHEAP_BASE_URL:
+                cheap_client = await stack.enter_async_context(AsyncOpenAI(
+                    base_url=AI_CHEAP_BASE_URL, api_key=AI_CHEAP_API_KEY or openai_api_key,
+                    timeout=OPENAI_HTTP_TIMEOUT, max_retries=0
+                ))
+            
+            async def complete(custom_id: str, request: Dict) -> str:
+                nonlocal finished
+                try:
+                    request_client = cheap_client if self._uses_cheap_server(custom_id) else client
+                    response = await self._acall_with_retry(request_client, request)
+                    return response.choices[0].message.content.strip()
+                finally:
+                    finished += 1
+                    self._progress(f"AI coaching insights {finished}/{len(requests_by_id)}")
+            
+            results = await asyncio.gather(
+                *(complete(custom_id, request) for custom_id, request in requests_by_id.items()),
+                return_exceptions=True
+            )
+        self._progress(None)
+        
+        # Failed requests are left out so the caller retries them directly
+        return {custom_id: text for custom_id, text in zip(requests_by_id, results) if isinstance(text, str)}
+
+    def _combined_request(self, requests_by_id: Dict[str, Dict]) -> Dict:
+        """Fold several requests into one that returns every section as a JSON object."""
+        section_rules = "\n".join(
+            f"- {custom_id}: {request['messages'][0]['content']}"
+            for custom_id, request in requests_by_id.items()
+        )
+        section_data = {
+            custom_id: json.loads(request["messages"][1]["content"])
+            for custom_id, request in requests_by_id.items()
+        }
+        
+        request = {
+            "model": self.model,
+            "messages": [{
+                "role": "system",
+                "content": f"{AI_SYSTEM_PROMPTS['combined_report']}\n{section_rules}"
+            }, {
+                "role": "user",
+                "content": json.dumps(section_data, separators=(",", ":"), ensure_ascii=False, default=str)
+            }],
+            "max_tokens": sum(request.get("max_tokens", 500) for request in requests_by_id.values()),
+            "temperature": 0.6,
+            "response_format": {
+                "type": "json_schema",
+                "json_schema": {
+                    "name": "CoachReport",
+                    "strict": True,
+                    "schema": {
+                        "type": "object",
+                        "properties": {custom_id: {"type": "string"} for custom_id in requests_by_id},
+                        "required": list(requests_by_id),
+                        "additionalProperties": False
+                    }
+                }
+            }
+        }
+        if OPENAI_SERVICE_TIER:
+            request["service_tier"] = OPENAI_SERVICE_TIER
+        
+        return request
+
+    def run_combined(self, requests_by_id: Dict[str, Dict]) -> Dict[str, str]:
+        """
+        Answer several requests with one structured-output chat completion.
+        
+        Args:
+            requests_by_id: Chat completion request bodies keyed by custom_id
+            
+        Returns:
+            Completion text keyed by custom_id (empty or missing sections are left out)
+        """
+        if not self.available or len(requests_by_id) < 2:
+            return {}
+            
+        try:
+            # The combined answer is cached under the combined request, not the per-section ones
+            request = self._combined_request(requests_by_id)
+            cached = self._cached_completion(request)
+            if cached is None:
+                # Stream so progress can be shown while the (long) combined answer is generated
+                stream = self._call_with_retry({**request, "stream": True})
+                parts = []
+                for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        parts.append(chunk.choices[0].delta.content)
+                        self._progress(f"Writing AI coaching insights... {sum(map(len, parts))} chars")
+                self._progress(None)
+            content = cached if cached is not None else "".join(parts)
+            sections = json.loads(content)
+            if cached is None:
+                self._store_completion(request, content)  # only once it parsed
+            
+            return {
+                custom_id: sections[custom_id].strip()
+                for custom_id in requests_by_id
+                if isinstance(sections.get(custom_id), str) and sections[custom_id].strip()
+            }
+            
+        except Exception as e:
+            print(f"⚠️ Combined AI request unavailable: {e}")
+            return {}
+
+    def run_concurrent(self, requests_by_id: Dict[str, Dict]) -> Dict[str, str]:
+        """
+        Run several chat completion requests concurrently.
+        
+        Args:
+            requests_by_id: Chat completion request bodies keyed by custom_id
+            
+        Returns:
+            Completion text keyed by custom_id (failed requests are left out)
+        """
+        if not self.available or not requests_by_id:
+            return {}
+            
+        try:
+            return asyncio.run(self._gather_chats(requests_by_id))
+            
+        except Exception as e:
+            print(f"⚠️ Concurrent AI requests unavailable: {e}")
+            return {}
+
+    def run_batch(self, requests_by_id: Dict[str, Dict], poll_interval: float = 10,
+                  timeout: float = 600) -> Dict[str, str]:
+        """
+        Run several chat completion requests as one OpenAI Batch API job.
+        
+        Args:
+            requests_by_id: Chat completion request bodies keyed by custom_id
+            poll_interval: Seconds between batch status checks
+            timeout: Seconds to wait for the batch before cancelling it
+            
+        Returns:
+            Completion text keyed by custom_id (failed requests are left out)
+        """
+        if not self.available or not requests_by_id:
+            return {}
+            
+        try:
+            batch_input = "\n".join(
+                json.dumps({"custom_id": custom_id, "method": "POST", "url": "/v1/chat/completions", "body": body})
+                for custom_id, body in requests_by_id.items()
+            )
+            input_file = openai_client.files.create(
+                file=("hevy_coach_batch.jsonl", batch_input.encode("utf-8")),
+                purpose="batch"
+            )
+            batch = openai_client.batches.create(
+                input_file_id=input_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            
+            deadline = time.monotonic() + timeout
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                if time.monotonic() >= deadline:
+                    openai_client.batches.cancel(batch.id)
+                    print(f"⚠️ AI batch not finished after {timeout:.0f}s, using direct requests")
+                    return {}
+                time.sleep(poll_interval)
+                batch = openai_client.batches.retrieve(batch.id)
+            
+            if batch.status != "completed" or not batch.output_file_id:
+                print(f"⚠️ AI batch {batch.status}, using direct requests")
+                return {}
+            
+            results = {}
+            for line in openai_client.files.content(batch.output_file_id).text.splitlines():
+                if not line.strip():
+                    continue
+                item = json.loads(line)
+                response = item.get("response") or {}
+                if response.get("status_code") == 200:
+                    results[item["custom_id"]] = response["body"]["choices"][0]["message"]["content"].strip()
+            
+            return results
+            
+        except Exception as e:
+            print(f"⚠️ AI batch unavailable: {e}")
+            return {}
+
+    def prefetch_report_insights(self, session_quality: Dict, last_session: Dict, progression_data: Dict,
+                                 periodization: Dict, comprehensive_trends: Dict,
+                                 next_workout_info: Dict, volume_recovery: Dict,
+                                 routine_recommendations: Optional[Dict] = None):
+        """
+        Fetch every prompt the report may need up front.
+        
+        Primary-model sections are asked for in one structured-output request,
+        or as a single Batch API job when use_batch is set; cheap-tier prompts
+        and anything those miss are sent concurrently. The generate_* methods
+        return these results instead of making their own request; anything
+        still missing falls back to a direct call.
+        """
+        # Mirror the conditions under which print_comprehensive_report asks for each insight
+        requests_by_id = {}
+        if last_session:
+            requests_by_id["session_summary"] = self._session_summary_request(
+                session_quality, last_session, comprehensive_trends
+            )
+            requests_by_id["next_session_focus"] = self._next_session_focus_request(last_session)
+            if progression_data and last_session.get("exercises"):
+                requests_by_id["exercise_insights"] = self._exercise_insights_request(last_session["exercises"])
+        if periodization:
+            requests_by_id["trend_analysis"] = self._trend_analysis_request(comprehensive_trends, periodization)
+        if (routine_recommendations or {}).get("type") == "workout_specific":
+            requests_by_id["next_day_overview"] = self._next_day_overview_request(
+                last_session, next_workout_info, comprehensive_trends, volume_recovery
+            )
+        if volume_recovery or next_workout_info.get("is_rest_day"):
+            requests_by_id["recovery_insights"] = self._recovery_insights_request(volume_recovery, comprehensive_trends)
+        
+        pending = {}
+        for custom_id, request in requests_by_id.items():
+            if not request:
+                continue
+            cached = self._cached_completion(request)
+            if cached is not None:
+                self._prefetched[custom_id] = cached
+            else:
+                pending[custom_id] = request
+        
+        # Batches and combined requests need a single model and server, so only prompts for the primary
+        # client and model join them
+        primary = {
+            custom_id: request for custom_id, request in pending.items()
+            if request["model"] == self.model and not self._uses_cheap_server(custom_id)
+        }
+        if self.use_batch:
+            results = self.run_batch(primary)
+            answered = dict(results)
+        else:
+            # run_combined caches its own answer; its sections did not come from the standalone requests
+            results = self.run_combined(primary)
+            answered = {}
+        answered.update(self.run_concurrent(
+            {custom_id: request for custom_id, request in pending.items() if custom_id not in results}
+        ))
+        results.update(answered)
+        
+        # Only answers to the standalone requests themselves are cached under those requests
+        for custom_id, text in answered.items():
+            self._store_completion(pending[custom_id], text)
+        self._prefetched.update(results)
+
 # Import routine configuration
 try:
     from routine_config import CYCLE_PATTERN, ROUTINE_TITLE_MAPPING, EXERCISE_PATTERNS
@@ -496,6 +879,11 @@ except ImportError:
     EXERCISE_PATTERNS = None
     ROUTINE_CONFIG_AVAILABLE = False
 
+# Routine templates rarely change - reuse a fetched copy for up to an hour
+ROUTINES_CACHE_DIR = os.path.expanduser(os.getenv("HEVY_ROUTINES_CACHE_DIR", "~/.cache/hevy_coach"))
+ROUTINES_CACHE_TTL = 3600  # seconds
+_routines_cache: Dict[str, List[Dict]] = {}  # api_key -> routines fetched this run
+
 class WorkoutCycle:
     """Manages cyclical workout routines and determines next workout day."""
     
@@ -514,6 +902,17 @@ class WorkoutCycle:
             self.exercise_patterns = EXERCISE_PATTERNS
             self.config_available = True
         
+        # (has_treadmill, has_rest) per cycle day, so rest-day matching doesn't re-scan titles
+        self._cycle_flags = [
+            ("treadmill" in day.lower(), "rest" in day.lower())
+            for day in (self.cycle_pattern or [])
+        ]
+        
+        # Reverse of routine_title_mapping: cycle day -> routine titles for that day
+        self._day_to_titles = defaultdict(set)
+        for title, day_idx in (self.routine_title_mapping or {}).items():
+            self._day_to_titles[day_idx].add(title)
+        
         self.client = None
     
     def is_available(self) -> bool:
@@ -526,24 +925,47 @@ class WorkoutCycle:
             self.client = HevyStatsClient(self.api_key)
         return self.client
     
-    def get_user_routines(self) -> List[Dict]:
-        """Fetch user's defined routines from Hevy API."""
+    def _routines_cache_file(self) -> str:
+        """Per-account cache file for fetched routines."""
+        key = hashlib.sha256(self.api_key.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(ROUTINES_CACHE_DIR, f"routines-{key}.json")
+    
+    def get_user_routines(self, refresh: bool = False) -> List[Dict]:
+        """Fetch user's defined routines from Hevy API (cached per run, and on disk for an hour unless refresh is set)."""
+        if self.api_key in _routines_cache:
+            return _routines_cache[self.api_key]
+        
+        if not refresh:
+            try:
+                cache_file = self._routines_cache_file()
+                if time.time() - os.path.getmtime(cache_file) < ROUTINES_CACHE_TTL:
+                    with open(cache_file, 'r', encoding='utf-8') as f:
+                        _routines_cache[self.api_key] = json.load(f)
+                    return _routines_cache[self.api_key]
+            except (OSError, ValueError):
+                pass
+        
         try:
             client = self._get_client()
-            response = requests.get(
-                "https://api.hevyapp.com/v1/routines",
-                headers={
-                    "accept": "application/json",
-                    "api-key": self.api_key
-                },
+            response = client.session.get(
+                f"{client.base_url}/v1/routines",
                 params={"page": 1, "pageSize": 10}
             )
             response.raise_for_status()
             data = response.json()
-            return data.get("routines", [])
+            routines = data.get("routines", [])
         except Exception as e:
             print(f"⚠️ Could not fetch routines: {e}")
             return []
+        
+        _routines_cache[self.api_key] = routines
+        try:
+            os.makedirs(ROUTINES_CACHE_DIR, exist_ok=True)
+            with open(self._routines_cache_file(), 'w', encoding='utf-8') as f:
+                json.dump(routines, f)
+        except OSError:
+            pass
+        return routines
     
     def determine_current_cycle_day(self, df: pd.DataFrame) -> int:
         """Determine which day of the cycle the user is currently on based on recent workouts."""
@@ -554,33 +976,33 @@ class WorkoutCycle:
             return 0  # Default to Day 1
         
         # Get unique workouts (by date and title) rather than individual exercise sets
-        workout_info = df.groupby(['date', 'workout']).first().reset_index()
-        recent_workouts = workout_info.sort_values('date').tail(5)  # Look at last 5 workouts
+        workout_info = df[['date', 'workout']].dropna().drop_duplicates()
+        recent_workouts = workout_info.sort_values(['date', 'workout'], kind='mergesort').tail(5)  # Look at last 5 workouts
         
         # First, check if the most recent workout (regardless of type) is a rest day
         last_workout = recent_workouts.iloc[-1]
         last_workout_title = last_workout.get('workout', '').lower()
         last_workout_date = last_workout.get('date')
-        exercises = df[df['date'] == last_workout_date]['exercise'].unique()
+        exercises = df.loc[df['date'] == last_workout_date, 'exercise'].unique()
         
         # Detect rest days by title patterns or cardio-only workouts
-        rest_day_indicators = ['rest', 'treadmill', 'cardio', 'recovery']
         is_likely_rest_day = (
-            any(indicator in last_workout_title for indicator in rest_day_indicators) or
-            (len(exercises) == 1 and 'treadmill' in ' '.join(exercises).lower())
+            REST_DAY_PATTERN.search(last_workout_title) is not None or
+            (len(exercises) == 1 and 'treadmill' in exercises[0].lower())
         )
         
         if is_likely_rest_day:
             # Find which rest day this might be by matching title patterns
+            title_has_treadmill = 'treadmill' in last_workout_title
+            title_has_rest = 'rest' in last_workout_title
             rest_day_match = None
-            for i, cycle_day in enumerate(self.cycle_pattern):
-                cycle_day_lower = cycle_day.lower()
-                if 'rest' in cycle_day_lower or 'treadmill' in cycle_day_lower:
+            for i, (day_has_treadmill, day_has_rest) in enumerate(self._cycle_flags):
+                if day_has_rest or day_has_treadmill:
                     # Check if this specific rest day matches the workout title better
-                    if 'treadmill' in last_workout_title and 'treadmill' in cycle_day_lower:
+                    if title_has_treadmill and day_has_treadmill:
                         rest_day_match = i
                         break
-                    elif 'rest' in last_workout_title and 'rest' in cycle_day_lower and 'treadmill' not in cycle_day_lower:
+                    elif title_has_rest and day_has_rest and not day_has_treadmill:
                         rest_day_match = i
                         break
                     elif rest_day_match is None:  # First rest day found as fallback
@@ -614,8 +1036,8 @@ class WorkoutCycle:
         # Default to Day 1 if can't determine
         return 0
     
-    def get_next_workout_info(self, df: pd.DataFrame) -> Dict:
-        """Get information about the next workout in the cycle."""
+    def get_next_workout_info(self, df: pd.DataFrame, refresh_routines: bool = False) -> Dict:
+        """Get information about the next workout in the cycle (refresh_routines bypasses the on-disk routines cache)."""
         if not self.config_available:
             return {"error": "No routine configuration available"}
             
@@ -623,14 +1045,9 @@ class WorkoutCycle:
         next_workout = self.cycle_pattern[current_day_idx]
         
         # Get routine info if available
-        routines = self.get_user_routines()
-        matching_routine = None
-        
-        for routine in routines:
-            if routine['title'] in self.routine_title_mapping:
-                if self.routine_title_mapping[routine['title']] == current_day_idx:
-                    matching_routine = routine
-                    break
+        routines = self.get_user_routines(refresh=refresh_routines)
+        candidate_titles = self._day_to_titles.get(current_day_idx, set())
+        matching_routine = next((routine for routine in routines if routine['title'] in candidate_titles), None)
         
         return {
             "cycle_day_index": current_day_idx,
@@ -657,18 +1074,14 @@ class WorkoutCycle:
         if not routine_data:
             return {"type": "general", "recommendations": ["No specific routine data available"]}
         
-        # Filter historical data for this specific routine
-        cycle_day_idx = next_workout_info["cycle_day_index"]
-        matching_workouts = []
-        
-        # Find historical data for this same workout type
-        for routine_title, day_idx in self.routine_title_mapping.items():
-            if day_idx == cycle_day_idx:
-                matching_workouts = df[df['workout'].str.contains(routine_title.split(' -')[0], na=False)]
-                break
+        names, weights, reps, rpes = [], [], [], []
         
-        recommendations = []
-        exercise_recommendations = {}
+        # Latest logged set per exercise, from one sorted pass over the history
+        latest_by_exercise = (
+            df.sort_values('date', kind='mergesort')
+            .drop_duplicates('exercise', keep='last')
+            .set_index('exercise')
+        )
         
         # Analyze each exercise in the upcoming routine
         for exercise_data in routine_data["exercises"]:
@@ -678,29 +1091,19 @@ class WorkoutCycle:
                 continue
                 
             # Find historical data for this exercise
-            exercise_history = df[df['exercise'] == exercise_name].sort_values('date')
-            
-            if len(exercise_history) > 0:
-                latest = exercise_history.iloc[-1]
+            if exercise_name in latest_by_exercise.index:
+                latest = latest_by_exercise.loc[exercise_name]
                 
                 # Get the target weight/reps from routine template
                 normal_sets = [s for s in exercise_data["sets"] if s["type"] == "normal"]
                 if normal_sets:
-                    template_weight = normal_sets[0].get("weight_kg")
-                    template_reps = normal_sets[0].get("reps")
-                    
-                    # Compare with latest performance
-                    last_weight = latest.get('weight', 0)
-                    last_reps = latest.get('reps', 0)
-                    last_rpe = latest.get('rpe', 8.0)
-                    
-                    recommendation = self._generate_exercise_recommendation(
-                        exercise_name, last_weight, last_reps, last_rpe, 
-                        template_weight, template_reps
-                    )
-                    
-                    if recommendation:
-                        exercise_recommendations[exercise_name] = recommendation
+                    # Collect latest performance; recommendations are scored in one batch below
+                    names.append(exercise_name)
+                    weights.append(latest.get('weight', 0))
+                    reps.append(latest.get('reps', 0))
+                    rpes.append(latest.get('rpe', 8.0))
+        
+        exercise_recommendations = self._generate_exercise_recommendations_batch(names, weights, reps, rpes)
         
         return {
             "type": "workout_specific",
@@ -713,86 +1116,745 @@ class WorkoutCycle:
             ]
         }
     
-    def _generate_exercise_recommendation(self, exercise_name: str, last_weight: float, 
-                                        last_reps: float, last_rpe: float,
-                                        template_weight: Optional[float], 
-                                        template_reps: Optional[int]) -> Dict:
-        """Generate specific recommendation for an exercise."""
-        recommendation = {
-            "current_weight": last_weight,
-            "current_reps": last_reps,
-            "last_rpe": last_rpe,
-            "action": "maintain",
-            "suggested_weight": last_weight,
-            "reasoning": ""
+    def _generate_exercise_recommendations_batch(self, names: List[str], weights: List[float],
+                                                 reps: List[float], rpes: List[float]) -> Dict[str, Dict]:
+        """
+        Generate RPE-based recommendations for many exercises at once.
+        
+        RPE below 7.5 or above 9.0 applies the matching RPE_POLICY entry; the weight
+        arithmetic is done as NumPy arrays over every exercise at once.
+        
+        Args:
+            names: Exercise names
+            weights: Latest weight per exercise
+            reps: Latest reps per exercise
+            rpes: Latest RPE per exercise
+            
+        Returns:
+            Dictionary mapping exercise name to its recommendation
+        """
+        if not names:
+            return {}
+        
+        weight_values = np.asarray(weights, dtype=float)
+        rpe_values = np.asarray(rpes, dtype=float)
+        is_assisted = np.array([is_assisted_exercise(name) for name in names])
+        
+        # RPE band: below 7.5 is too easy, above 9.0 is too hard, anything else is on target
+        low = rpe_values < 7.5
+        high = rpe_values > 9.0
+        
+        # Policy entry per exercise (assisted exercises invert the direction); in-band rows are
+        # looked up as "high" but their adjustment is never used
+        policies = [RPE_POLICY[("low" if is_low else "high", bool(assisted))]
+                    for is_low, assisted in zip(low, is_assisted)]
+        sign = np.array([policy[1] for policy in policies])
+        pct = np.array([policy[2] for policy in policies])
+        # At least RPE_MIN_DELTA_KG or pct of the current weight (fmax skips NaN weights)
+        delta = np.fmax(RPE_MIN_DELTA_KG, weight_values * pct)
+        suggested = weight_values + sign * delta
+        suggested = np.where(sign < 0, np.fmax(0, suggested), suggested)
+        
+        recommendations = [
+            {
+                "current_weight": weight,
+                "current_reps": rep,
+                "last_rpe": rpe,
+                "action": "maintain",
+                "suggested_weight": weight,
+                "reasoning": RPE_MAINTAIN_REASONING.format(rpe=rpe)
+            }
+            for weight, rep, rpe in zip(weights, reps, rpes)
+        ]
+        
+        # Only exercises outside the target RPE band need an adjustment written up
+        for i in np.flatnonzero(low | high):
+            action, _, _, reasoning = policies[i]
+            recommendations[i].update({
+                "action": action,
+                "suggested_weight": suggested[i].item(),
+                "reasoning": reasoning.format(rpe=rpes[i], delta=delta[i])
+            })
+        
+        return dict(zip(names, recommendations))
+
+# "<emoji> **Label**: value" metric lines, styled by their leading emoji
+METRIC_LINE_PATTERN = re.compile(r'^([🎯📝💪🔥📈📅📊]) \*\*(.+?)\*\*: (.+)$', re.MULTILINE)
+METRIC_CLASSES = {
+    "🎯": "primary", "📝": "secondary", "💪": "success", "🔥": "warning",
+    "📈": "info", "📅": "info", "📊": "info"
+}
+METRIC_STYLES = {
+    "🎯": "background: #e3f2fd; border-left: 4px solid #2196f3;",
+    "📝": "background: #f3e5f5; border-left: 4px solid #9c27b0;",
+    "💪": "background: #e8f5e8; border-left: 4px solid #4caf50;",
+    "🔥": "background: #fff3e0; border-left: 4px solid #ff9800;",
+    "📈": "background: #f0f4c3; border-left: 4px solid #8bc34a;",
+    "📅": "background: #f0f4c3; border-left: 4px solid #8bc34a;",
+    "📊": "background: #f0f4c3; border-left: 4px solid #8bc34a;"
+}
+
+# Recommendation section header lines and the HTML each one opens (one pass, looked up by line)
+RECOMMENDATION_HEADER_HTML = {
+    "📈 **Suggested Increases**:": '<div class="recommendations increases"><h4>📈 Suggested Increases</h4><ul>',
+    "📉 **Suggested Decreases**:": '<div class="recommendations decreases"><h4>📉 Suggested Decreases</h4><ul>',
+    "✅ **Maintain Current Weights**:": '<div class="recommendations maintain"><h4>✅ Maintain Current Weights</h4><ul>',
+    "💡 **General Recommendations**:": '</ul></div><div class="recommendations general"><h4>💡 General Recommendations</h4><ul>'
+}
+RECOMMENDATION_HEADER_PATTERN = re.compile(
+    "^(" + "|".join(re.escape(header) for header in RECOMMENDATION_HEADER_HTML) + ")$", re.MULTILINE
+)
+
+# Nested and top-level bullet lines, with or without a "**Name**: text" lead (one pass, first form wins)
+BULLET_LINE_PATTERN = re.compile(
+    r'^(?:   • \*\*(?P<rec_name>.+?)\*\*: (?P<rec_text>.+)'
+    r'|   • (?P<general>.+)'
+    r'|• \*\*(?P<point_name>.+?)\*\*: (?P<point_text>.+)'
+    r'|• (?P<point>.+))$',
+    re.MULTILINE
+)
+
+def _bullet_line_html(match: re.Match) -> str:
+    """Render a BULLET_LINE_PATTERN match as the list item for its bullet form."""
+    if match["rec_name"] is not None:
+        return f'<li class="exercise-rec"><strong>{match["rec_name"]}</strong>: {match["rec_text"]}</li>'
+    if match["general"] is not None:
+        return f'<li class="general-rec">{match["general"]}</li>'
+    if match["point_name"] is not None:
+        return f'<li class="main-point"><strong>{match["point_name"]}</strong>: {match["point_text"]}</li>'
+    return f'<li class="main-point">{match["point"]}</li>'
+
+# Grades like "B+ (82/100)", trend emojis and percentages; the three forms share no characters,
+# so one scan styles them exactly as separate passes would
+INLINE_SPAN_PATTERN = re.compile(
+    r'(?P<grade>A\+|A|B\+|B|C\+|C|D) \((?P<score>\d+)/100\)'
+    r'|(?P<trend>📈|📉|➡️|⬇️|⬆️|🎯|⚠️|✅|🔄|🏆)'
+    r'|(?P<percentage>[+-]?\d+\.?\d*%)'
+)
+
+def _inline_span_html(match: re.Match) -> str:
+    """Render an INLINE_SPAN_PATTERN match as the styled span for its kind."""
+    if match["grade"] is not None:
+        return f'<span class="grade grade-{match["grade"]}">{match["grade"]} ({match["score"]}/100)</span>'
+    if match["trend"] is not None:
+        return f'<span class="trend">{match["trend"]}</span>'
+    return f'<span class="percentage">{match["percentage"]}</span>'
+
+# Ordered (guard, pattern, replacement) passes used by EmailSender.markdown_to_html;
+# a pass only runs when its guard text is in the HTML so far ('' always runs)
+MARKDOWN_HTML_RULES = [
+    # Convert main headers with special styling
+    ('🏋️‍♂️  ', re.compile(r'^🏋️‍♂️  (.+)$', re.MULTILINE), r'<h1 class="main-title">🏋️‍♂️ \1</h1>'),
+    ('🚀 ', re.compile(r'^🚀 (.+)$', re.MULTILINE), r'<div class="quick-summary-header"><h1>🚀 \1</h1></div>'),
+    
+    # Convert section headers with emojis (handle both formats)
+    ('**', re.compile(r'^(⭐|📈|🎯|🔄|📊|🏆|📋|🤖|⚡|💪|😴|📅|📚) \*\*(.+?)\*\*$', re.MULTILINE), r'<h2 class="section-header">\1 <strong>\2</strong></h2>'),
+    ('', re.compile(r'^(⭐|📈|🎯|🔄|📊|🏆|📋|🤖|⚡|💪|😴|📅|📚) (.+)$', re.MULTILINE), r'<h2 class="section-header">\1 \2</h2>'),
+    
+    # Convert subsection headers
+    ('**', re.compile(r'^\*\*(.+?)\*\*$', re.MULTILINE), r'<h3 class="subsection-header">\1</h3>'),
+    
+    # Convert bold text
+    ('**', re.compile(r'\*\*(.*?)\*\*'), r'<strong>\1</strong>'),
+    
+    # Convert section dividers
+    ('-' * 50, re.compile(r'^-{50,}$', re.MULTILINE), '<hr class="section-divider">'),
+    ('=' * 50, re.compile(r'^={50,}$', re.MULTILINE), '<hr class="major-divider">'),
+    
+    # Convert AI sections with special styling
+    ('🤖 **', re.compile(r'^🤖 \*\*(.+?)\*\*:$', re.MULTILINE), r'<div class="ai-section"><h3>🤖 \1</h3>'),
+    ('   ', re.compile(r'^   (.+)$', re.MULTILINE), r'<div class="ai-content">\1</div>'),
+    
+    # Handle multi-line AI content
+    ('🤖 **', re.compile(r'(🤖 \*\*[^:]+\*\*:.*?)(?=\n\n|\n[^   ]|\Z)', re.DOTALL), r'<div class="ai-section">\1</div>'),
+    
+    # Convert metric lines with special styling (one pass, class picked by emoji)
+    ('**', METRIC_LINE_PATTERN, lambda m: f'<div class="metric {METRIC_CLASSES[m[1]]}">{m[1]} <strong>{m[2]}</strong>: {m[3]}</div>'),
+    
+    # Convert exercise recommendations with special styling
+    ('**:', RECOMMENDATION_HEADER_PATTERN, lambda m: RECOMMENDATION_HEADER_HTML[m[1]]),
+    
+    # Handle session data lines
+    ('   Sessions: ', re.compile(r'   Sessions: (.+)$', re.MULTILINE), r'<div class="session-data">Sessions: \1</div>'),
+    ('   Trend: ', re.compile(r'   Trend: (.+)$', re.MULTILINE), r'<div class="session-data">Trend: \1</div>'),
+    ('   Overall: ', re.compile(r'   Overall: (.+)$', re.MULTILINE), r'<div class="session-data">Overall: \1</div>'),
+    ('   Peak RPE: ', re.compile(r'   Peak RPE: (.+)$', re.MULTILINE), r'<div class="session-data">Peak RPE: \1</div>'),
+    
+    # Convert bullet points with proper nesting
+    ('• ', BULLET_LINE_PATTERN, _bullet_line_html),
+    
+    # Convert exercise analysis blocks (both with and without indentation)
+    ('**', re.compile(r'^\*\*(.+?)\*\*\n((?:   .+\n)*)', re.MULTILINE | re.DOTALL), r'<div class="exercise-analysis"><h4>\1</h4><div class="exercise-details">\2</div></div>'),
+    
+    # Handle exercise names with session data
+    ('**', re.compile(r'^\*\*([^*]+)\*\*$', re.MULTILINE), r'<h4 class="exercise-name">\1</h4>'),
+    
+    # Convert priority actions
+    ('⚡ **Priority Actions**:', re.compile(r'^⚡ \*\*Priority Actions\*\*:$', re.MULTILINE), r'<div class="priority-actions"><h3>⚡ Priority Actions</h3><ol>'),
+    ('   ', re.compile(r'^   (\d+)\. (.+)$', re.MULTILINE), r'<li class="priority-item">\2</li>'),
+    
+    # Handle numbered lists that might appear in coaching content
+    ('. ', re.compile(r'^(\d+)\. (.+)$', re.MULTILINE), r'<ol><li>\2</li></ol>'),
+    
+    # Convert progress indicators
+    ('📊 **Overall Progress**: ', re.compile(r'^📊 \*\*Overall Progress\*\*: (.+)$', re.MULTILINE), r'<div class="overall-progress">📊 <strong>Overall Progress</strong>: \1</div>'),
+    
+    # Convert grades, trend emojis and percentages to styled spans (one pass)
+    ('', INLINE_SPAN_PATTERN, _inline_span_html),
+    
+    # Wrap consecutive list items in ul tags where not already wrapped
+    ('<li class="main-point">', re.compile(r'(<li class="main-point">.*?</li>(?:\n<li class="main-point">.*?</li>)*)', re.DOTALL), r'<ul class="main-list">\1</ul>'),
+]
+
+# Something at least one MARKDOWN_HTML_RULES pass needs; content without any of these skips the passes
+MARKDOWN_HTML_TRIGGER = re.compile(
+    r'\*\*|-{50}|={50}|   |• |%|/100\)|main-point|^\d+\. '
+    r'|[🏋🚀⭐📈📉🎯🔄📊🏆📋🤖⚡💪😴📅📚📝🔥✅💡➡⬇⬆⚠]',
+    re.MULTILINE
+)
+
+# Paragraphs containing any of these tags are already HTML and are not wrapped in <p> by markdown_to_html
+BLOCK_TAG_PATTERN = re.compile(r'<(?:div|h|ul|ol|li)')
+
+# Ordered (pattern, replacement) passes used by EmailSender.simple_markdown_to_html
+SIMPLE_MARKDOWN_HTML_RULES = [
+    # Convert main title
+    (re.compile(r'^🏋️‍♂️  (.+)$', re.MULTILINE), r'<h1 style="text-align: center; color: #2c3e50; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 15px; border-radius: 8px; margin: 20px 0;">\1</h1>'),
+    
+    # Convert section headers
+    (re.compile(r'^(⭐|📈|🎯|🔄|📊|🏆|📋) \*\*(.+?)\*\*$', re.MULTILINE), r'<h2 style="color: #34495e; border-left: 4px solid #3498db; padding-left: 10px; background: #f8f9fa; padding: 10px; margin: 20px 0;">\1 <strong>\2</strong></h2>'),
+    
+    # Convert subsection headers
+    (re.compile(r'^\*\*(.+?)\*\*$', re.MULTILINE), r'<h3 style="color: #2c3e50; margin: 15px 0 10px 0;">\1</h3>'),
+    
+    # Convert bold text
+    (re.compile(r'\*\*(.*?)\*\*'), r'<strong>\1</strong>'),
+    
+    # Convert section dividers
+    (re.compile(r'^-{50,}$', re.MULTILINE), '<hr style="border: none; border-top: 1px solid #dee2e6; margin: 20px 0;">'),
+    (re.compile(r'^={50,}$', re.MULTILINE), '<hr style="border: none; border-top: 3px solid #3498db; margin: 30px 0;">'),
+    
+    # Convert key metrics with colors (one pass, colours picked by emoji)
+    (METRIC_LINE_PATTERN, lambda m: f'<div style="{METRIC_STYLES[m[1]]} padding: 12px; margin: 8px 0; border-radius: 4px;"><strong>{m[2]}</strong>: {m[3]}</div>'),
+    
+    # Convert exercise recommendations
+    (re.compile(r'^📈 \*\*Suggested Increases\*\*:$', re.MULTILINE), r'<div style="background: #e8f5e8; border-left: 4px solid #4caf50; padding: 15px; margin: 15px 0; border-radius: 4px;"><h4 style="margin-top: 0;">📈 Suggested Increases</h4><ul>'),
+    (re.compile(r'^📉 \*\*Suggested Decreases\*\*:$', re.MULTILINE), r'<div style="background: #ffebee; border-left: 4px solid #f44336; padding: 15px; margin: 15px 0; border-radius: 4px;"><h4 style="margin-top: 0;">📉 Suggested Decreases</h4><ul>'),
+    (re.compile(r'^✅ \*\*Maintain Current Weights\*\*:$', re.MULTILINE), r'<div style="background: #e3f2fd; border-left: 4px solid #2196f3; padding: 15px; margin: 15px 0; border-radius: 4px;"><h4 style="margin-top: 0;">✅ Maintain Current Weights</h4><ul>'),
+    (re.compile(r'^💡 \*\*General Recommendations\*\*:$', re.MULTILINE), r'</ul></div><div style="background: #f3e5f5; border-left: 4px solid #9c27b0; padding: 15px; margin: 15px 0; border-radius: 4px;"><h4 style="margin-top: 0;">💡 General Recommendations</h4><ul>'),
+    
+    # Convert bullet points
+    (re.compile(r'^   • \*\*(.+?)\*\*: (.+)$', re.MULTILINE), r'<li style="margin: 8px 0;"><strong>\1</strong>: \2</li>'),
+    (re.compile(r'^   • (.+)$', re.MULTILINE), r'<li style="margin: 6px 0;">\1</li>'),
+    (re.compile(r'^• \*\*(.+?)\*\*: (.+)$', re.MULTILINE), r'<li style="margin: 8px 0;"><strong>\1</strong>: \2</li>'),
+    (re.compile(r'^• (.+)$', re.MULTILINE), r'<li style="margin: 8px 0;">\1</li>'),
+]
+
+# Ordered (pattern, replacement) passes used by EmailSender.markdown_to_plain_text
+PLAIN_TEXT_RULES = [
+    # Remove markdown bold formatting
+    (re.compile(r'\*\*(.*?)\*\*'), r'\1'),
+    
+    # Clean up section dividers
+    (re.compile(r'^-{50,}$', re.MULTILINE), '─' * 50),
+    (re.compile(r'^={50,}$', re.MULTILINE), '═' * 50),
+]
+
+# Report line markers picked up by EmailSender.create_plain_text_summary, with their summary labels
+SUMMARY_FIELDS = (
+    ("🎯 **Overall Grade**:", "📊 Overall Grade"),
+    ("📝 **Assessment**:", "📝 Assessment"),
+    ("💪 **Progression**:", "💪 Progression"),
+    ("📅 **Latest Session**:", "📅 Latest Session"),
+    ("📅 **Next Workout**:", "🎯 Next Workout")
+)
+
+# Runs of 3+ line breaks collapsed by simple_markdown_to_html
+EXTRA_BREAKS_PATTERN = re.compile(r'(<br>\n){3,}')
+
+# Static <head> (including all CSS) of the HTML report email, up to the content container
+EMAIL_HTML_HEAD = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <style>
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Arial, sans-serif;
+            line-height: 1.6;
+            color: #333;
+            max-width: 800px;
+            margin: 0 auto;
+            padding: 10px;
+            background-color: #f8f9fa;
+        }
+        .container {
+            background-color: white;
+            padding: 20px;
+            border-radius: 8px;
+            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
         }
         
-        # Check if this is an assisted exercise (weight = assistance, higher = easier)
-        is_assisted = is_assisted_exercise(exercise_name)
-        
-        # RPE-based recommendations
-        if last_rpe < 7.5:
-            # Too easy - need to make it harder
-            if is_assisted:
-                # For assisted exercises: decrease assistance weight to make it harder
-                suggested_decrease = max(2.5, last_weight * 0.025)  # At least 2.5kg or 2.5% decrease
-                recommendation.update({
-                    "action": "decrease",
-                    "suggested_weight": max(0, last_weight - suggested_decrease),
-                    "reasoning": f"RPE {last_rpe} too low, reduce assistance by {suggested_decrease:.1f}kg to make it harder"
-                })
-            else:
-                # For regular exercises: increase load weight
-                suggested_increase = max(2.5, last_weight * 0.025)  # At least 2.5kg or 2.5% increase
-                recommendation.update({
-                    "action": "increase",
-                    "suggested_weight": last_weight + suggested_increase,
-                    "reasoning": f"RPE {last_rpe} indicates room for progression (+{suggested_increase:.1f}kg)"
-                })
-        elif last_rpe > 9.0:
-            # Too hard - need to make it easier
-            if is_assisted:
-                # For assisted exercises: increase assistance weight to make it easier
-                suggested_increase = max(2.5, last_weight * 0.05)  # At least 2.5kg or 5% increase
-                recommendation.update({
-                    "action": "increase",
-                    "suggested_weight": last_weight + suggested_increase,
-                    "reasoning": f"RPE {last_rpe} too high, increase assistance by {suggested_increase:.1f}kg for better form"
-                })
-            else:
-                # For regular exercises: decrease load weight
-                suggested_decrease = max(2.5, last_weight * 0.05)  # At least 2.5kg or 5% decrease
-                recommendation.update({
-                    "action": "decrease", 
-                    "suggested_weight": max(0, last_weight - suggested_decrease),
-                    "reasoning": f"RPE {last_rpe} too high, reduce by {suggested_decrease:.1f}kg for better form"
-                })
-        else:
-            recommendation["reasoning"] = f"RPE {last_rpe} is in good range - maintain current weight"
+        /* Headers */
+        h1.main-title {
+            color: #2c3e50;
+            border-bottom: 3px solid #3498db;
+            padding: 15px;
+            margin-bottom: 20px;
+            font-size: 1.8em;
+            text-align: center;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            border-radius: 8px;
+        }
+        .quick-summary-header h1 {
+            background: linear-gradient(135deg, #ff9a9e 0%, #fecfef 100%);
+            color: #2c3e50;
+            padding: 15px;
+            border-radius: 8px;
+            text-align: center;
+            margin: 20px 0;
+            font-size: 1.5em;
+        }
+        h2.section-header {
+            color: #34495e;
+            border-bottom: 2px solid #ecf0f1;
+            padding: 12px 0 8px 0;
+            margin-top: 30px;
+            margin-bottom: 15px;
+            font-size: 1.3em;
+            background: #f8f9fa;
+            padding-left: 10px;
+            border-left: 4px solid #3498db;
+        }
+        h3.subsection-header {
+            color: #2c3e50;
+            margin-top: 20px;
+            margin-bottom: 10px;
+            font-size: 1.1em;
+            padding: 8px 0;
+            border-bottom: 1px solid #dee2e6;
+        }
+        h4 {
+            color: #2c3e50;
+            margin: 15px 0 8px 0;
+            font-size: 1.0em;
+        }
+        
+        /* Text styling */
+        p {
+            margin: 10px 0;
+        }
+        strong {
+            color: #2c3e50;
+        }
+        
+        /* Lists */
+        ul, ol {
+            margin: 10px 0;
+            padding-left: 25px;
+        }
+        li {
+            margin: 5px 0;
+        }
+        
+        /* Code and preformatted text */
+        pre, code {
+            background-color: #f8f9fa;
+            padding: 2px 6px;
+            border-radius: 4px;
+            font-family: 'Monaco', 'Menlo', monospace;
+            font-size: 0.9em;
+        }
+        pre {
+            padding: 12px;
+            margin: 10px 0;
+            overflow-x: auto;
+            border-left: 4px solid #3498db;
+        }
+        
+        /* AI sections */
+        .ai-section {
+            background: linear-gradient(135deg, #e3f2fd 0%, #f3e5f5 100%);
+            border-left: 4px solid #2196f3;
+            padding: 15px;
+            margin: 15px 0;
+            border-radius: 0 6px 6px 0;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
+        .ai-section h3 {
+            margin-top: 0;
+            color: #1976d2;
+            font-size: 1.1em;
+        }
+        .ai-content {
+            margin: 8px 0;
+            line-height: 1.6;
+            color: #424242;
+        }
+        
+        /* Metrics */
+        .metric {
+            padding: 12px 15px;
+            margin: 8px 0;
+            border-radius: 6px;
+            border-left: 4px solid;
+            font-weight: 500;
+        }
+        .metric.primary {
+            background: #e3f2fd;
+            border-color: #2196f3;
+        }
+        .metric.secondary {
+            background: #f3e5f5;
+            border-color: #9c27b0;
+        }
+        .metric.success {
+            background: #e8f5e8;
+            border-color: #4caf50;
+        }
+        .metric.warning {
+            background: #fff3e0;
+            border-color: #ff9800;
+        }
+        .metric.info {
+            background: #f0f4c3;
+            border-color: #8bc34a;
+        }
+        
+        /* Recommendations */
+        .recommendations {
+            margin: 15px 0;
+            padding: 15px;
+            border-radius: 6px;
+            border-left: 4px solid;
+        }
+        .recommendations.increases {
+            background: #e8f5e8;
+            border-color: #4caf50;
+        }
+        .recommendations.decreases {
+            background: #ffebee;
+            border-color: #f44336;
+        }
+        .recommendations.maintain {
+            background: #e3f2fd;
+            border-color: #2196f3;
+        }
+        .recommendations.general {
+            background: #f3e5f5;
+            border-color: #9c27b0;
+        }
+        .recommendations h4 {
+            margin-top: 0;
+            margin-bottom: 10px;
+        }
+        .recommendations ul {
+            margin: 10px 0;
+            padding-left: 20px;
+        }
+        .exercise-rec {
+            margin: 8px 0;
+            padding: 4px 0;
+        }
+        .general-rec {
+            margin: 6px 0;
+        }
+        
+        /* Exercise Analysis */
+        .exercise-analysis {
+            background: #f8f9fa;
+            border: 1px solid #dee2e6;
+            border-radius: 6px;
+            margin: 10px 0;
+            padding: 12px;
+        }
+        .exercise-analysis h4, h4.exercise-name {
+            margin-top: 0;
+            margin-bottom: 8px;
+            color: #2c3e50;
+            border-bottom: 1px solid #dee2e6;
+            padding-bottom: 4px;
+        }
+        .exercise-details {
+            font-size: 0.95em;
+            line-height: 1.5;
+        }
+        
+        /* Session data formatting */
+        .session-data {
+            margin: 8px 0;
+            padding: 8px;
+            background: #e9ecef;
+            border-radius: 4px;
+            font-family: monospace;
+        }
+        
+        /* Priority Actions */
+        .priority-actions {
+            background: #fff3cd;
+            border-left: 4px solid #ffc107;
+            padding: 15px;
+            margin: 15px 0;
+            border-radius: 0 6px 6px 0;
+        }
+        .priority-actions h3 {
+            margin-top: 0;
+            color: #856404;
+        }
+        .priority-actions ol {
+            margin: 10px 0;
+            padding-left: 25px;
+        }
+        .priority-item {
+            margin: 8px 0;
+            font-weight: 500;
+        }
+        
+        /* Overall Progress */
+        .overall-progress {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 15px;
+            border-radius: 6px;
+            text-align: center;
+            margin: 15px 0;
+            font-weight: bold;
+        }
+        
+        /* Grades and indicators */
+        .grade {
+            padding: 4px 8px;
+            border-radius: 4px;
+            font-weight: bold;
+            margin: 0 4px;
+        }
+        .grade-A, .grade-A\\+ {
+            background: #4caf50;
+            color: white;
+        }
+        .grade-B, .grade-B\\+ {
+            background: #8bc34a;
+            color: white;
+        }
+        .grade-C, .grade-C\\+ {
+            background: #ff9800;
+            color: white;
+        }
+        .grade-D {
+            background: #f44336;
+            color: white;
+        }
+        
+        .trend {
+            font-size: 1.2em;
+            margin: 0 4px;
+        }
+        
+        .percentage {
+            font-weight: bold;
+            padding: 2px 4px;
+            border-radius: 3px;
+            background: #f8f9fa;
+        }
+        
+        /* Horizontal rules */
+        hr.section-divider {
+            border: none;
+            border-top: 1px solid #dee2e6;
+            margin: 20px 0;
+        }
+        hr.major-divider {
+            border: none;
+            border-top: 3px solid #3498db;
+            margin: 30px 0;
+        }
+        
+        /* Lists */
+        ul.main-list {
+            margin: 15px 0;
+            padding-left: 25px;
+        }
+        li.main-point {
+            margin: 8px 0;
+            line-height: 1.5;
+        }
+        
+        /* Tables */
+        table {
+            width: 100%;
+            border-collapse: collapse;
+            margin: 15px 0;
+            background: white;
+            border-radius: 6px;
+            overflow: hidden;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
+        th, td {
+            border: 1px solid #dee2e6;
+            padding: 12px 15px;
+            text-align: left;
+        }
+        th {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            font-weight: bold;
+        }
+        tr:nth-child(even) {
+            background: #f8f9fa;
+        }
+        
+        /* Mobile responsiveness */
+        @media (max-width: 600px) {
+            body {
+                padding: 5px;
+            }
+            .container {
+                padding: 15px;
+            }
+            h1 {
+                font-size: 1.4em;
+            }
+            h2 {
+                font-size: 1.2em;
+            }
+            h3 {
+                font-size: 1.0em;
+            }
+            pre {
+                font-size: 0.8em;
+                padding: 8px;
+            }
+            table {
+                font-size: 0.9em;
+            }
+            th, td {
+                padding: 6px 8px;
+            }
+        }
         
-        return recommendation
+        /* Print styles */
+        @media print {
+            .container {
+                box-shadow: none;
+                border: 1px solid #ccc;
+            }
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+"""
+
+# Closing footer of the HTML report email; filled in per send with format_map
+EMAIL_HTML_FOOTER = """
+        <div class="footer" style="margin-top: 40px; padding-top: 20px; border-top: 2px solid #ecf0f1; text-align: center; color: #7f8c8d; font-size: 0.9em;">
+            <p><strong>📧 Generated on {generated}</strong></p>
+            <p>🤖 Enhanced with AI coaching insights | 💪 Keep crushing your goals!</p>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+# Plain-text alternative of the report email; filled in per send with format_map
+EMAIL_TEXT_BODY = """🏋️‍♂️ Daily Hevy Coaching Report
+
+Generated: {generated}
+
+{summary}
+
+─────────────────────────────────────────────────────────────
+💡 AI-powered coaching analysis
+Generated by Hevy Coach Pro
+"""
+
+# Converted report bodies kept per EmailSender, so re-sending the same report skips markdown_to_html
+EMAIL_HTML_CACHE_SIZE = 8
 
 class EmailSender:
     """Handle email notifications for Hevy coaching reports."""
     
     def __init__(self):
-        self.email_user = os.getenv("EMAIL_USER")
-        self.email_password = os.getenv("EMAIL_PASSWORD")
-        self.to_email = os.getenv("TO_EMAIL", self.email_user)  # Default to sender if not specified
-        self.smtp_server = os.getenv("SMTP_SERVER", "smtp.gmail.com")
-        self.smtp_port = int(os.getenv("SMTP_PORT", "587"))
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._html_cache: OrderedDict = OrderedDict()
+    
+    # Settings are read from the environment on first use, then kept for the sender's lifetime
+    @cached_property
+    def email_user(self) -> Optional[str]:
+        return os.getenv("EMAIL_USER")
+    
+    @cached_property
+    def email_password(self) -> Optional[str]:
+        return os.getenv("EMAIL_PASSWORD")
+    
+    @cached_property
+    def to_email(self) -> Optional[str]:
+        return os.getenv("TO_EMAIL", self.email_user)  # Default to sender if not specified
+    
+    @cached_property
+    def smtp_server(self) -> str:
+        return os.getenv("SMTP_SERVER", "smtp.gmail.com")
+    
+    @cached_property
+    def smtp_port(self) -> int:
+        port = os.getenv("SMTP_PORT", "587")
+        try:
+            return int(port)
+        except ValueError:
+            print(f"⚠️ Invalid SMTP_PORT '{port}', using 587")
+            return 587
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+    
+    def _ensure_connected(self) -> smtplib.SMTP:
+        """
+        Return a logged-in SMTP connection, reusing the open one while it is alive.
+        
+        Returns:
+            Connected SMTP server (TLS handshake and login already done)
+        """
+        if self._smtp is not None:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            self.close()
+        
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+        try:
+            server.starttls()
+            server.login(self.email_user, self.email_password)
+        except Exception:
+            server.close()
+            raise
+        self._smtp = server
+        return server
+    
+    def close(self):
+        """Close the pooled SMTP connection, if one is open."""
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            self._smtp.close()
+        self._smtp = None
     
     def test_connection(self) -> bool:
-        """Test email configuration without sending."""
+        """Test email configuration without sending (the connection is kept open for send_report)."""
         if not self.email_user or not self.email_password:
             print("❌ Missing EMAIL_USER or EMAIL_PASSWORD environment variables")
             return False
         
         try:
-            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
-            server.starttls()
-            server.login(self.email_user, self.email_password)
-            server.quit()
+            self._ensure_connected()
             print(f"✅ Successfully connected to {self.smtp_server}")
             return True
         except Exception as e:
@@ -808,11 +1870,14 @@ class EmailSender:
             return False
         
         try:
+            # One timestamp for the subject and both bodies
+            now = datetime.now()
+            
             # Create message
-            msg = MIMEMultipart('alternative')
+            msg = EmailMessage()
             msg['From'] = self.email_user
             msg['To'] = self.to_email
-            msg['Subject'] = f"🏋️‍♂️ Hevy Coaching Report - {datetime.now().strftime('%Y-%m-%d')}"
+            msg['Subject'] = f"🏋️‍♂️ Hevy Coaching Report - {now.strftime('%Y-%m-%d')}"
             
             # Use markdown file content if available, otherwise use report_content
             content_to_convert = report_content
@@ -833,433 +1898,41 @@ class EmailSender:
             has_ai_content = "🤖" in content_to_convert
             
             # Always use the full coaching report content directly
-            full_html_content = self.markdown_to_html(content_to_convert)
+            full_html_content = self._cached_markdown_to_html(content_to_convert)
             if has_ai_content:
                 print("📧 Email includes full AI coaching insights")
             else:
                 print("📧 Email includes full coaching report with structured recommendations")
             
-            # Create comprehensive HTML email body
-            html_body = f"""
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <meta charset="UTF-8">
-                <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                <style>
-                    body {{
-                        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Arial, sans-serif;
-                        line-height: 1.6;
-                        color: #333;
-                        max-width: 800px;
-                        margin: 0 auto;
-                        padding: 10px;
-                        background-color: #f8f9fa;
-                    }}
-                    .container {{
-                        background-color: white;
-                        padding: 20px;
-                        border-radius: 8px;
-                        box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-                    }}
-                    
-                    /* Headers */
-                    h1.main-title {{
-                        color: #2c3e50;
-                        border-bottom: 3px solid #3498db;
-                        padding: 15px;
-                        margin-bottom: 20px;
-                        font-size: 1.8em;
-                        text-align: center;
-                        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                        color: white;
-                        border-radius: 8px;
-                    }}
-                    .quick-summary-header h1 {{
-                        background: linear-gradient(135deg, #ff9a9e 0%, #fecfef 100%);
-                        color: #2c3e50;
-                        padding: 15px;
-                        border-radius: 8px;
-                        text-align: center;
-                        margin: 20px 0;
-                        font-size: 1.5em;
-                    }}
-                    h2.section-header {{
-                        color: #34495e;
-                        border-bottom: 2px solid #ecf0f1;
-                        padding: 12px 0 8px 0;
-                        margin-top: 30px;
-                        margin-bottom: 15px;
-                        font-size: 1.3em;
-                        background: #f8f9fa;
-                        padding-left: 10px;
-                        border-left: 4px solid #3498db;
-                    }}
-                    h3.subsection-header {{
-                        color: #2c3e50;
-                        margin-top: 20px;
-                        margin-bottom: 10px;
-                        font-size: 1.1em;
-                        padding: 8px 0;
-                        border-bottom: 1px solid #dee2e6;
-                    }}
-                    h4 {{
-                        color: #2c3e50;
-                        margin: 15px 0 8px 0;
-                        font-size: 1.0em;
-                    }}
-                    
-                    /* Text styling */
-                    p {{
-                        margin: 10px 0;
-                    }}
-                    strong {{
-                        color: #2c3e50;
-                    }}
-                    
-                    /* Lists */
-                    ul, ol {{
-                        margin: 10px 0;
-                        padding-left: 25px;
-                    }}
-                    li {{
-                        margin: 5px 0;
-                    }}
-                    
-                    /* Code and preformatted text */
-                    pre, code {{
-                        background-color: #f8f9fa;
-                        padding: 2px 6px;
-                        border-radius: 4px;
-                        font-family: 'Monaco', 'Menlo', monospace;
-                        font-size: 0.9em;
-                    }}
-                    pre {{
-                        padding: 12px;
-                        margin: 10px 0;
-                        overflow-x: auto;
-                        border-left: 4px solid #3498db;
-                    }}
-                    
-                    /* AI sections */
-                    .ai-section {{
-                        background: linear-gradient(135deg, #e3f2fd 0%, #f3e5f5 100%);
-                        border-left: 4px solid #2196f3;
-                        padding: 15px;
-                        margin: 15px 0;
-                        border-radius: 0 6px 6px 0;
-                        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-                    }}
-                    .ai-section h3 {{
-                        margin-top: 0;
-                        color: #1976d2;
-                        font-size: 1.1em;
-                    }}
-                    .ai-content {{
-                        margin: 8px 0;
-                        line-height: 1.6;
-                        color: #424242;
-                    }}
-                    
-                    /* Metrics */
-                    .metric {{
-                        padding: 12px 15px;
-                        margin: 8px 0;
-                        border-radius: 6px;
-                        border-left: 4px solid;
-                        font-weight: 500;
-                    }}
-                    .metric.primary {{
-                        background: #e3f2fd;
-                        border-color: #2196f3;
-                    }}
-                    .metric.secondary {{
-                        background: #f3e5f5;
-                        border-color: #9c27b0;
-                    }}
-                    .metric.success {{
-                        background: #e8f5e8;
-                        border-color: #4caf50;
-                    }}
-                    .metric.warning {{
-                        background: #fff3e0;
-                        border-color: #ff9800;
-                    }}
-                    .metric.info {{
-                        background: #f0f4c3;
-                        border-color: #8bc34a;
-                    }}
-                    
-                    /* Recommendations */
-                    .recommendations {{
-                        margin: 15px 0;
-                        padding: 15px;
-                        border-radius: 6px;
-                        border-left: 4px solid;
-                    }}
-                    .recommendations.increases {{
-                        background: #e8f5e8;
-                        border-color: #4caf50;
-                    }}
-                    .recommendations.decreases {{
-                        background: #ffebee;
-                        border-color: #f44336;
-                    }}
-                    .recommendations.maintain {{
-                        background: #e3f2fd;
-                        border-color: #2196f3;
-                    }}
-                    .recommendations.general {{
-                        background: #f3e5f5;
-                        border-color: #9c27b0;
-                    }}
-                    .recommendations h4 {{
-                        margin-top: 0;
-                        margin-bottom: 10px;
-                    }}
-                    .recommendations ul {{
-                        margin: 10px 0;
-                        padding-left: 20px;
-                    }}
-                    .exercise-rec {{
-                        margin: 8px 0;
-                        padding: 4px 0;
-                    }}
-                    .general-rec {{
-                        margin: 6px 0;
-                    }}
-                    
-                    /* Exercise Analysis */
-                    .exercise-analysis {{
-                        background: #f8f9fa;
-                        border: 1px solid #dee2e6;
-                        border-radius: 6px;
-                        margin: 10px 0;
-                        padding: 12px;
-                    }}
-                    .exercise-analysis h4, h4.exercise-name {{
-                        margin-top: 0;
-                        margin-bottom: 8px;
-                        color: #2c3e50;
-                        border-bottom: 1px solid #dee2e6;
-                        padding-bottom: 4px;
-                    }}
-                    .exercise-details {{
-                        font-size: 0.95em;
-                        line-height: 1.5;
-                    }}
-                    
-                    /* Session data formatting */
-                    .session-data {{
-                        margin: 8px 0;
-                        padding: 8px;
-                        background: #e9ecef;
-                        border-radius: 4px;
-                        font-family: monospace;
-                    }}
-                    
-                    /* Priority Actions */
-                    .priority-actions {{
-                        background: #fff3cd;
-                        border-left: 4px solid #ffc107;
-                        padding: 15px;
-                        margin: 15px 0;
-                        border-radius: 0 6px 6px 0;
-                    }}
-                    .priority-actions h3 {{
-                        margin-top: 0;
-                        color: #856404;
-                    }}
-                    .priority-actions ol {{
-                        margin: 10px 0;
-                        padding-left: 25px;
-                    }}
-                    .priority-item {{
-                        margin: 8px 0;
-                        font-weight: 500;
-                    }}
-                    
-                    /* Overall Progress */
-                    .overall-progress {{
-                        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                        color: white;
-                        padding: 15px;
-                        border-radius: 6px;
-                        text-align: center;
-                        margin: 15px 0;
-                        font-weight: bold;
-                    }}
-                    
-                    /* Grades and indicators */
-                    .grade {{
-                        padding: 4px 8px;
-                        border-radius: 4px;
-                        font-weight: bold;
-                        margin: 0 4px;
-                    }}
-                    .grade-A, .grade-A\\+ {{
-                        background: #4caf50;
-                        color: white;
-                    }}
-                    .grade-B, .grade-B\\+ {{
-                        background: #8bc34a;
-                        color: white;
-                    }}
-                    .grade-C, .grade-C\\+ {{
-                        background: #ff9800;
-                        color: white;
-                    }}
-                    .grade-D {{
-                        background: #f44336;
-                        color: white;
-                    }}
-                    
-                    .trend {{
-                        font-size: 1.2em;
-                        margin: 0 4px;
-                    }}
-                    
-                    .percentage {{
-                        font-weight: bold;
-                        padding: 2px 4px;
-                        border-radius: 3px;
-                        background: #f8f9fa;
-                    }}
-                    
-                    /* Horizontal rules */
-                    hr.section-divider {{
-                        border: none;
-                        border-top: 1px solid #dee2e6;
-                        margin: 20px 0;
-                    }}
-                    hr.major-divider {{
-                        border: none;
-                        border-top: 3px solid #3498db;
-                        margin: 30px 0;
-                    }}
-                    
-                    /* Lists */
-                    ul.main-list {{
-                        margin: 15px 0;
-                        padding-left: 25px;
-                    }}
-                    li.main-point {{
-                        margin: 8px 0;
-                        line-height: 1.5;
-                    }}
-                    
-                    /* Tables */
-                    table {{
-                        width: 100%;
-                        border-collapse: collapse;
-                        margin: 15px 0;
-                        background: white;
-                        border-radius: 6px;
-                        overflow: hidden;
-                        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-                    }}
-                    th, td {{
-                        border: 1px solid #dee2e6;
-                        padding: 12px 15px;
-                        text-align: left;
-                    }}
-                    th {{
-                        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                        color: white;
-                        font-weight: bold;
-                    }}
-                    tr:nth-child(even) {{
-                        background: #f8f9fa;
-                    }}
-                    
-                    /* Mobile responsiveness */
-                    @media (max-width: 600px) {{
-                        body {{
-                            padding: 5px;
-                        }}
-                        .container {{
-                            padding: 15px;
-                        }}
-                        h1 {{
-                            font-size: 1.4em;
-                        }}
-                        h2 {{
-                            font-size: 1.2em;
-                        }}
-                        h3 {{
-                            font-size: 1.0em;
-                        }}
-                        pre {{
-                            font-size: 0.8em;
-                            padding: 8px;
-                        }}
-                        table {{
-                            font-size: 0.9em;
-                        }}
-                        th, td {{
-                            padding: 6px 8px;
-                        }}
-                    }}
-                    
-                    /* Print styles */
-                    @media print {{
-                        .container {{
-                            box-shadow: none;
-                            border: 1px solid #ccc;
-                        }}
-                    }}
-                </style>
-            </head>
-            <body>
-                <div class="container">
-                    {full_html_content}
-                    
-                    <div class="footer" style="margin-top: 40px; padding-top: 20px; border-top: 2px solid #ecf0f1; text-align: center; color: #7f8c8d; font-size: 0.9em;">
-                        <p><strong>📧 Generated on {datetime.now().strftime('%Y-%m-%d at %H:%M')}</strong></p>
-                        <p>🤖 Enhanced with AI coaching insights | 💪 Keep crushing your goals!</p>
-                    </div>
-                </div>
-            </body>
-            </html>
-            """
+            # Create comprehensive HTML email body (static head and CSS are built once at import)
+            html_body = EMAIL_HTML_HEAD + full_html_content + EMAIL_HTML_FOOTER.format_map({
+                "generated": now.strftime('%Y-%m-%d at %H:%M')
+            })
             
             # Create plain text fallback (condensed version)
             plain_text = self.create_plain_text_summary(report_content)
-            text_body = f"""🏋️‍♂️ Daily Hevy Coaching Report
-
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M UTC')}
-
-{plain_text}
-
-─────────────────────────────────────────────────────────────
-💡 AI-powered coaching analysis
-Generated by Hevy Coach Pro
-            """
+            text_body = EMAIL_TEXT_BODY.format_map({
+                "generated": now.strftime('%Y-%m-%d %H:%M UTC'),
+                "summary": plain_text
+            })
             
-            # Attach both HTML and plain text versions
-            msg.attach(MIMEText(text_body, 'plain', 'utf-8'))
-            msg.attach(MIMEText(html_body, 'html', 'utf-8'))
+            # Plain text body with the HTML version as its alternative
+            msg.set_content(text_body)
+            msg.add_alternative(html_body, subtype='html')
             
             # Still attach markdown file as backup (optional)
             if markdown_file and os.path.exists(markdown_file):
                 with open(markdown_file, "rb") as attachment:
-                    part = MIMEBase('application', 'octet-stream')
-                    part.set_payload(attachment.read())
-                
-                encoders.encode_base64(part)
-                part.add_header(
-                    'Content-Disposition',
-                    f'attachment; filename= {os.path.basename(markdown_file)}'
-                )
-                msg.attach(part)
+                    msg.add_attachment(
+                        attachment.read(),
+                        maintype='application',
+                        subtype='octet-stream',
+                        filename=os.path.basename(markdown_file)
+                    )
             
-            # Send email
-            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
-            server.starttls()
-            server.login(self.email_user, self.email_password)
-            text = msg.as_string()
-            server.sendmail(self.email_user, self.to_email, text)
-            server.quit()
+            # Send email over the pooled connection (reconnects if it has dropped)
+            server = self._ensure_connected()
+            server.send_message(msg, self.email_user, self.to_email)
             
             print(f"✅ Report emailed successfully to {self.to_email}")
             return True
@@ -1268,168 +1941,121 @@ Generated by Hevy Coach Pro
             print(f"❌ Failed to send email: {e}")
             return False
     
-    def create_plain_text_summary(self, content: str) -> str:
-        """Create a plain text summary of key points."""
-        lines = content.split('\n')
-        
-        summary = ""
-        
-        # Extract key info from the actual coaching report format
-        for line in lines:
-            if "🎯 **Overall Grade**:" in line:
-                grade = line.split(":", 1)[1].strip()
-                summary += f"📊 Overall Grade: {grade}\n"
-            elif "📝 **Assessment**:" in line:
-                assessment = line.split(":", 1)[1].strip()
-                summary += f"📝 Assessment: {assessment}\n"
-            elif "💪 **Progression**:" in line:
-                progression = line.split(":", 1)[1].strip()
-                summary += f"💪 Progression: {progression}\n"
-            elif "📅 **Latest Session**:" in line:
-                session = line.split(":", 1)[1].strip()
-                summary += f"📅 Latest Session: {session}\n"
-            elif "📅 **Next Workout**:" in line:
-                workout = line.split(":", 1)[1].strip()
-                summary += f"🎯 Next Workout: {workout}\n"
-        
-        # Extract AI coach insights
-        ai_insights = []
-        in_ai_section = False
-        for line in lines:
-            if "🤖 **AI COACH INSIGHTS**:" in line:
-                in_ai_section = True
-                continue
-            elif in_ai_section and line.strip() and not line.startswith("🎯"):
-                if line.strip() and len(ai_insights) < 2:  # Get first 2 lines of AI insights
-                    ai_insights.append(line.strip())
-            elif "🎯 **Next Session Focus**:" in line:
-                in_ai_section = False
-                break
+    def _cached_markdown_to_html(self, content: str) -> str:
+        """
+        Convert report markdown to HTML, reusing the result when identical content is sent again.
         
-        if ai_insights:
-            summary += f"\n🤖 AI INSIGHTS:\n"
-            for insight in ai_insights:
-                summary += f"• {insight}\n"
+        Args:
+            content: Report markdown
+            
+        Returns:
+            HTML body content
+        """
+        key = hashlib.blake2b(content.encode('utf-8'), digest_size=16).hexdigest()
+        html = self._html_cache.get(key)
+        if html is not None:
+            self._html_cache.move_to_end(key)
+            return html
+        
+        html = self.markdown_to_html(content)
+        self._html_cache[key] = html
+        if len(self._html_cache) > EMAIL_HTML_CACHE_SIZE:
+            self._html_cache.popitem(last=False)
+        return html
+    
+    def _parse_report_summary(self, content: str) -> Dict:
+        """
+        Scan the report once for everything the plain-text summary needs.
         
-        # Extract priority actions
+        Args:
+            content: Coaching report text
+            
+        Returns:
+            Dictionary with key metric lines, up to 2 AI insights and up to 2 priority actions
+        """
+        key_lines = []
+        ai_insights = []
         priority_actions = []
-        in_priority = False
-        for line in lines:
-            if "⚡ **Priority Actions**:" in line:
-                in_priority = True
-                continue
-            elif in_priority and line.startswith("   1."):
-                action = line[6:].strip()  # Remove "   1. "
-                priority_actions.append(action)
-            elif in_priority and line.startswith("   2."):
-                action = line[6:].strip()  # Remove "   2. "
-                priority_actions.append(action)
-                break  # Stop after getting 2 actions
-            elif in_priority and line.strip() and not line.strip().startswith("   "):
-                in_priority = False
-        
-        if priority_actions:
-            summary += f"\n⚡ PRIORITY ACTIONS:\n"
-            for i, action in enumerate(priority_actions, 1):
-                summary += f"{i}. {action}\n"
+        in_ai_section = ai_done = False
+        in_priority = priority_done = False
+        
+        for line in content.split('\n'):
+            # Extract key info from the actual coaching report format (every marker ends in "**:")
+            if "**:" in line:
+                for marker, label in SUMMARY_FIELDS:
+                    if marker in line:
+                        key_lines.append(f"{label}: {line.partition(':')[2].strip()}")
+                        break
+            
+            # Extract AI coach insights (first 2 lines, up to the Next Session Focus)
+            if not ai_done:
+                if "🤖 **AI COACH INSIGHTS**:" in line:
+                    in_ai_section = True
+                elif in_ai_section and line.strip() and not line.startswith("🎯"):
+                    if len(ai_insights) < 2:
+                        ai_insights.append(line.strip())
+                elif "🎯 **Next Session Focus**:" in line:
+                    ai_done = True
+            
+            # Extract priority actions (stop after getting 2 actions)
+            if not priority_done:
+                if "⚡ **Priority Actions**:" in line:
+                    in_priority = True
+                elif in_priority and line.startswith("   1."):
+                    priority_actions.append(line[6:].strip())  # Remove "   1. "
+                elif in_priority and line.startswith("   2."):
+                    priority_actions.append(line[6:].strip())  # Remove "   2. "
+                    priority_done = True
+                elif in_priority and line.strip():
+                    in_priority = False
         
-        return summary
+        return {
+            "key_lines": key_lines,
+            "ai_insights": ai_insights,
+            "priority_actions": priority_actions
+        }
     
-    def markdown_to_html(self, content: str) -> str:
-        """Convert markdown-formatted report content to properly formatted HTML."""
-        import re
-        
-        # Start with the content
-        html = content
-        
-        # Convert main headers with special styling
-        html = re.sub(r'^🏋️‍♂️  (.+)$', r'<h1 class="main-title">🏋️‍♂️ \1</h1>', html, flags=re.MULTILINE)
-        html = re.sub(r'^🚀 (.+)$', r'<div class="quick-summary-header"><h1>🚀 \1</h1></div>', html, flags=re.MULTILINE)
-        
-        # Convert section headers with emojis (handle both formats)
-        html = re.sub(r'^(⭐|📈|🎯|🔄|📊|🏆|📋|🤖|⚡|💪|😴|📅|📚) \*\*(.+?)\*\*$', r'<h2 class="section-header">\1 <strong>\2</strong></h2>', html, flags=re.MULTILINE)
-        html = re.sub(r'^(⭐|📈|🎯|🔄|📊|🏆|📋|🤖|⚡|💪|😴|📅|📚) (.+)$', r'<h2 class="section-header">\1 \2</h2>', html, flags=re.MULTILINE)
-        
-        # Convert subsection headers
-        html = re.sub(r'^\*\*(.+?)\*\*$', r'<h3 class="subsection-header">\1</h3>', html, flags=re.MULTILINE)
-        
-        # Convert bold text
-        html = re.sub(r'\*\*(.*?)\*\*', r'<strong>\1</strong>', html)
-        
-        # Convert section dividers
-        html = re.sub(r'^-{50,}$', '<hr class="section-divider">', html, flags=re.MULTILINE)
-        html = re.sub(r'^={50,}$', '<hr class="major-divider">', html, flags=re.MULTILINE)
-        
-        # Convert AI sections with special styling
-        html = re.sub(r'^🤖 \*\*(.+?)\*\*:$', r'<div class="ai-section"><h3>🤖 \1</h3>', html, flags=re.MULTILINE)
-        html = re.sub(r'^   (.+)$', r'<div class="ai-content">\1</div>', html, flags=re.MULTILINE)
-        
-        # Handle multi-line AI content
-        html = re.sub(r'(🤖 \*\*[^:]+\*\*:.*?)(?=\n\n|\n[^   ]|\Z)', r'<div class="ai-section">\1</div>', html, flags=re.DOTALL)
-        
-        # Convert metric lines with special styling
-        html = re.sub(r'^🎯 \*\*(.+?)\*\*: (.+)$', r'<div class="metric primary">🎯 <strong>\1</strong>: \2</div>', html, flags=re.MULTILINE)
-        html = re.sub(r'^📝 \*\*(.+?)\*\*: (.+)$', r'<div class="metric secondary">📝 <strong>\1</strong>: \2</div>', html, flags=re.MULTILINE)
-        html = re.sub(r'^💪 \*\*(.+?)\*\*: (.+)$', r'<div class="metric success">💪 <strong>\1</strong>: \2</div>', html, flags=re.MULTILINE)
-        html = re.sub(r'^🔥 \*\*(.+?)\*\*: (.+)$', r'<div class="metric warning">🔥 <strong>\1</strong>: \2</div>', html, flags=re.MULTILINE)
-        html = re.sub(r'^📈 \*\*(.+?)\*\*: (.+)$', r'<div class="metric info">📈 <strong>\1</strong>: \2</div>', html, flags=re.MULTILINE)
-        html = re.sub(r'^📅 \*\*(.+?)\*\*: (.+)$', r'<div class="metric info">📅 <strong>\1</strong>: \2</div>', html, flags=re.MULTILINE)
-        html = re.sub(r'^📊 \*\*(.+?)\*\*: (.+)$', r'<div class="metric info">📊 <strong>\1</strong>: \2</div>', html, flags=re.MULTILINE)
-        
-        # Convert exercise recommendations with special styling
-        html = re.sub(r'^📈 \*\*Suggested Increases\*\*:$', r'<div class="recommendations increases"><h4>📈 Suggested Increases</h4><ul>', html, flags=re.MULTILINE)
-        html = re.sub(r'^📉 \*\*Suggested Decreases\*\*:$', r'<div class="recommendations decreases"><h4>📉 Suggested Decreases</h4><ul>', html, flags=re.MULTILINE)
-        html = re.sub(r'^✅ \*\*Maintain Current Weights\*\*:$', r'<div class="recommendations maintain"><h4>✅ Maintain Current Weights</h4><ul>', html, flags=re.MULTILINE)
-        html = re.sub(r'^💡 \*\*General Recommendations\*\*:$', r'</ul></div><div class="recommendations general"><h4>💡 General Recommendations</h4><ul>', html, flags=re.MULTILINE)
-        
-        # Handle session data lines
-        html = re.sub(r'   Sessions: (.+)$', r'<div class="session-data">Sessions: \1</div>', html, flags=re.MULTILINE)
-        html = re.sub(r'   Trend: (.+)$', r'<div class="session-data">Trend: \1</div>', html, flags=re.MULTILINE)
-        html = re.sub(r'   Overall: (.+)$', r'<div class="session-data">Overall: \1</div>', html, flags=re.MULTILINE)
-        html = re.sub(r'   Peak RPE: (.+)$', r'<div class="session-data">Peak RPE: \1</div>', html, flags=re.MULTILINE)
-        
-        # Convert bullet points with proper nesting
-        html = re.sub(r'^   • \*\*(.+?)\*\*: (.+)$', r'<li class="exercise-rec"><strong>\1</strong>: \2</li>', html, flags=re.MULTILINE)
-        html = re.sub(r'^   • (.+)$', r'<li class="general-rec">\1</li>', html, flags=re.MULTILINE)
-        html = re.sub(r'^• \*\*(.+?)\*\*: (.+)$', r'<li class="main-point"><strong>\1</strong>: \2</li>', html, flags=re.MULTILINE)
-        html = re.sub(r'^• (.+)$', r'<li class="main-point">\1</li>', html, flags=re.MULTILINE)
-        
-        # Convert exercise analysis blocks (both with and without indentation)
-        html = re.sub(r'^\*\*(.+?)\*\*\n((?:   .+\n)*)', r'<div class="exercise-analysis"><h4>\1</h4><div class="exercise-details">\2</div></div>', html, flags=re.MULTILINE | re.DOTALL)
-        
-        # Handle exercise names with session data
-        html = re.sub(r'^\*\*([^*]+)\*\*$', r'<h4 class="exercise-name">\1</h4>', html, flags=re.MULTILINE)
-        
-        # Convert priority actions  
-        html = re.sub(r'^⚡ \*\*Priority Actions\*\*:$', r'<div class="priority-actions"><h3>⚡ Priority Actions</h3><ol>', html, flags=re.MULTILINE)
-        html = re.sub(r'^   (\d+)\. (.+)$', r'<li class="priority-item">\2</li>', html, flags=re.MULTILINE)
+    def create_plain_text_summary(self, content: str) -> str:
+        """Create a plain text summary of key points."""
+        parsed = self._parse_report_summary(content)
         
-        # Handle numbered lists that might appear in coaching content
-        html = re.sub(r'^(\d+)\. (.+)$', r'<ol><li>\2</li></ol>', html, flags=re.MULTILINE)
+        summary = [f"{line}\n" for line in parsed["key_lines"]]
         
-        # Convert progress indicators
-        html = re.sub(r'^📊 \*\*Overall Progress\*\*: (.+)$', r'<div class="overall-progress">📊 <strong>Overall Progress</strong>: \1</div>', html, flags=re.MULTILINE)
+        if parsed["ai_insights"]:
+            summary.append(f"\n🤖 AI INSIGHTS:\n")
+            for insight in parsed["ai_insights"]:
+                summary.append(f"• {insight}\n")
         
-        # Convert grades to styled spans
-        html = re.sub(r'(A\+|A|B\+|B|C\+|C|D) \((\d+)/100\)', r'<span class="grade grade-\1">\1 (\2/100)</span>', html)
+        if parsed["priority_actions"]:
+            summary.append(f"\n⚡ PRIORITY ACTIONS:\n")
+            for i, action in enumerate(parsed["priority_actions"], 1):
+                summary.append(f"{i}. {action}\n")
         
-        # Convert trend emojis to styled spans
-        html = re.sub(r'(📈|📉|➡️|⬇️|⬆️|🎯|⚠️|✅|🔄|🏆)', r'<span class="trend">\1</span>', html)
+        return "".join(summary)
+    
+    def markdown_to_html(self, content: str) -> str:
+        """Convert markdown-formatted report content to properly formatted HTML."""
         
-        # Convert percentages to styled spans
-        html = re.sub(r'([+-]?\d+\.?\d*%)', r'<span class="percentage">\1</span>', html)
+        # Start with the content
+        html = content
         
-        # Wrap consecutive list items in ul tags where not already wrapped
-        html = re.sub(r'(<li class="main-point">.*?</li>(?:\n<li class="main-point">.*?</li>)*)', r'<ul class="main-list">\1</ul>', html, flags=re.DOTALL)
+        # Apply each conversion pass in order (plain text such as failure notices has nothing to convert)
+        if MARKDOWN_HTML_TRIGGER.search(html):
+            for guard, pattern, replacement in MARKDOWN_HTML_RULES:
+                if guard in html:
+                    html = pattern.sub(replacement, html)
         
-        # Close open recommendation divs
         html = html.replace('</ul></div><div class="recommendations', '</ul></div>\n<div class="recommendations')
-        html = html + '</ul></div>' if 'recommendations' in html and not html.endswith('</ul></div>') else html
-        
-        # Close priority actions
         html = html.replace('<ol>\n<li class="priority-item">', '<ol><li class="priority-item">')
-        if 'priority-actions' in html and not html.endswith('</ol></div>'):
-            html = html + '</ol></div>'
+        
+        # Close open recommendation divs, then priority actions, appending both closers in one join
+        closers = []
+        if 'recommendations' in html and not html.endswith('</ul></div>'):
+            closers.append('</ul></div>')
+        if 'priority-actions' in html and (closers or not html.endswith('</ol></div>')):
+            closers.append('</ol></div>')
+        if closers:
+            html = "".join([html, *closers])
         
         # Convert line breaks to HTML paragraphs for better structure
         # Split into paragraphs first
@@ -1440,7 +2066,7 @@ Generated by Hevy Coach Pro
             para = para.strip()
             if para:
                 # Don't wrap if already has HTML tags
-                if '<div' in para or '<h' in para or '<ul' in para or '<ol' in para or '<li' in para:
+                if BLOCK_TAG_PATTERN.search(para):
                     formatted_paragraphs.append(para)
                 else:
                     # Wrap plain text in paragraphs
@@ -1453,46 +2079,12 @@ Generated by Hevy Coach Pro
     
     def simple_markdown_to_html(self, content: str) -> str:
         """Convert markdown content to HTML with simpler formatting for when AI is unavailable."""
-        import re
         
         html = content
         
-        # Convert main title
-        html = re.sub(r'^🏋️‍♂️  (.+)$', r'<h1 style="text-align: center; color: #2c3e50; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 15px; border-radius: 8px; margin: 20px 0;">\1</h1>', html, flags=re.MULTILINE)
-        
-        # Convert section headers
-        html = re.sub(r'^(⭐|📈|🎯|🔄|📊|🏆|📋) \*\*(.+?)\*\*$', r'<h2 style="color: #34495e; border-left: 4px solid #3498db; padding-left: 10px; background: #f8f9fa; padding: 10px; margin: 20px 0;">\1 <strong>\2</strong></h2>', html, flags=re.MULTILINE)
-        
-        # Convert subsection headers  
-        html = re.sub(r'^\*\*(.+?)\*\*$', r'<h3 style="color: #2c3e50; margin: 15px 0 10px 0;">\1</h3>', html, flags=re.MULTILINE)
-        
-        # Convert bold text
-        html = re.sub(r'\*\*(.*?)\*\*', r'<strong>\1</strong>', html)
-        
-        # Convert section dividers
-        html = re.sub(r'^-{50,}$', '<hr style="border: none; border-top: 1px solid #dee2e6; margin: 20px 0;">', html, flags=re.MULTILINE)
-        html = re.sub(r'^={50,}$', '<hr style="border: none; border-top: 3px solid #3498db; margin: 30px 0;">', html, flags=re.MULTILINE)
-        
-        # Convert key metrics with colors
-        html = re.sub(r'^🎯 \*\*(.+?)\*\*: (.+)$', r'<div style="background: #e3f2fd; border-left: 4px solid #2196f3; padding: 12px; margin: 8px 0; border-radius: 4px;"><strong>\1</strong>: \2</div>', html, flags=re.MULTILINE)
-        html = re.sub(r'^📝 \*\*(.+?)\*\*: (.+)$', r'<div style="background: #f3e5f5; border-left: 4px solid #9c27b0; padding: 12px; margin: 8px 0; border-radius: 4px;"><strong>\1</strong>: \2</div>', html, flags=re.MULTILINE)
-        html = re.sub(r'^💪 \*\*(.+?)\*\*: (.+)$', r'<div style="background: #e8f5e8; border-left: 4px solid #4caf50; padding: 12px; margin: 8px 0; border-radius: 4px;"><strong>\1</strong>: \2</div>', html, flags=re.MULTILINE)
-        html = re.sub(r'^🔥 \*\*(.+?)\*\*: (.+)$', r'<div style="background: #fff3e0; border-left: 4px solid #ff9800; padding: 12px; margin: 8px 0; border-radius: 4px;"><strong>\1</strong>: \2</div>', html, flags=re.MULTILINE)
-        html = re.sub(r'^📈 \*\*(.+?)\*\*: (.+)$', r'<div style="background: #f0f4c3; border-left: 4px solid #8bc34a; padding: 12px; margin: 8px 0; border-radius: 4px;"><strong>\1</strong>: \2</div>', html, flags=re.MULTILINE)
-        html = re.sub(r'^📅 \*\*(.+?)\*\*: (.+)$', r'<div style="background: #f0f4c3; border-left: 4px solid #8bc34a; padding: 12px; margin: 8px 0; border-radius: 4px;"><strong>\1</strong>: \2</div>', html, flags=re.MULTILINE)
-        html = re.sub(r'^📊 \*\*(.+?)\*\*: (.+)$', r'<div style="background: #f0f4c3; border-left: 4px solid #8bc34a; padding: 12px; margin: 8px 0; border-radius: 4px;"><strong>\1</strong>: \2</div>', html, flags=re.MULTILINE)
-        
-        # Convert exercise recommendations
-        html = re.sub(r'^📈 \*\*Suggested Increases\*\*:$', r'<div style="background: #e8f5e8; border-left: 4px solid #4caf50; padding: 15px; margin: 15px 0; border-radius: 4px;"><h4 style="margin-top: 0;">📈 Suggested Increases</h4><ul>', html, flags=re.MULTILINE)
-        html = re.sub(r'^📉 \*\*Suggested Decreases\*\*:$', r'<div style="background: #ffebee; border-left: 4px solid #f44336; padding: 15px; margin: 15px 0; border-radius: 4px;"><h4 style="margin-top: 0;">📉 Suggested Decreases</h4><ul>', html, flags=re.MULTILINE)
-        html = re.sub(r'^✅ \*\*Maintain Current Weights\*\*:$', r'<div style="background: #e3f2fd; border-left: 4px solid #2196f3; padding: 15px; margin: 15px 0; border-radius: 4px;"><h4 style="margin-top: 0;">✅ Maintain Current Weights</h4><ul>', html, flags=re.MULTILINE)
-        html = re.sub(r'^💡 \*\*General Recommendations\*\*:$', r'</ul></div><div style="background: #f3e5f5; border-left: 4px solid #9c27b0; padding: 15px; margin: 15px 0; border-radius: 4px;"><h4 style="margin-top: 0;">💡 General Recommendations</h4><ul>', html, flags=re.MULTILINE)
-        
-        # Convert bullet points
-        html = re.sub(r'^   • \*\*(.+?)\*\*: (.+)$', r'<li style="margin: 8px 0;"><strong>\1</strong>: \2</li>', html, flags=re.MULTILINE)
-        html = re.sub(r'^   • (.+)$', r'<li style="margin: 6px 0;">\1</li>', html, flags=re.MULTILINE)
-        html = re.sub(r'^• \*\*(.+?)\*\*: (.+)$', r'<li style="margin: 8px 0;"><strong>\1</strong>: \2</li>', html, flags=re.MULTILINE)
-        html = re.sub(r'^• (.+)$', r'<li style="margin: 8px 0;">\1</li>', html, flags=re.MULTILINE)
+        # Apply each conversion pass in order
+        for pattern, replacement in SIMPLE_MARKDOWN_HTML_RULES:
+            html = pattern.sub(replacement, html)
         
         # Close any open divs
         if 'recommendations' in html and not html.endswith('</ul></div>'):
@@ -1502,30 +2094,39 @@ Generated by Hevy Coach Pro
         html = html.replace('\n', '<br>\n')
         
         # Clean up extra line breaks
-        html = re.sub(r'(<br>\n){3,}', '<br><br>\n', html)
+        html = EXTRA_BREAKS_PATTERN.sub('<br><br>\n', html)
         
         return html
     
     def markdown_to_plain_text(self, content: str) -> str:
         """Convert markdown-formatted content to clean plain text."""
-        import re
         
         # Start with the content
         text = content
         
-        # Remove markdown bold formatting
-        text = re.sub(r'\*\*(.*?)\*\*', r'\1', text)
-        
-        # Clean up section dividers
-        text = re.sub(r'^-{50,}$', '─' * 50, text, flags=re.MULTILINE)
-        text = re.sub(r'^={50,}$', '═' * 50, text, flags=re.MULTILINE)
-        
-        # Convert bullet points to simple dashes
-        text = re.sub(r'^• ', '• ', text, flags=re.MULTILINE)
-        text = re.sub(r'^  • ', '  • ', text, flags=re.MULTILINE)
+        # Apply each conversion pass in order
+        for pattern, replacement in PLAIN_TEXT_RULES:
+            text = pattern.sub(replacement, text)
         
         return text
 
+_email_sender: Optional[EmailSender] = None
+
+def get_email_sender() -> EmailSender:
+    """
+    Return the shared EmailSender, creating it on first use.
+    
+    Returns:
+        EmailSender whose settings, SMTP connection and HTML cache are reused across reports
+    """
+    global _email_sender
+    if _email_sender is None:
+        _email_sender = EmailSender()
+    return _email_sender
+
+# Concurrent page requests when fetching workout history (the session pools up to 8 connections)
+HEVY_FETCH_WORKERS = 4
+
 class HevyStatsClient:
     def __init__(self, api_key: str):
         if not api_key:
@@ -1536,9 +2137,23 @@ class HevyStatsClient:
         self.api_key = api_key
         self.base_url = "https://api.hevyapp.com"
         self.headers = {
+            "accept": "application/json",
             "api-key": api_key,
             "Content-Type": "application/json"
         }
+        
+        # One keep-alive session for every Hevy request, retrying transient gateway errors
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        ))
+    
+    def close(self):
+        """Close the pooled HTTP session."""
+        self.session.close()
     
     def get_workout_events(self, page: int = 1, page_size: int = 10, since: Optional[str] = None) -> Dict:
         """
@@ -1566,7 +2181,7 @@ class HevyStatsClient:
         url = f"{self.base_url}/v1/workouts/events"
         
         try:
-            response = requests.get(url, headers=self.headers, params=params)
+            response = self.session.get(url, params=params)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -1587,12 +2202,22 @@ class HevyStatsClient:
         since = since_date.isoformat() + "Z"
         
         all_events = []
-        page = 1
         
         print(f"🔄 Fetching workout events from last {days} days...")
         
-        while True:
-            data = self.get_workout_events(page=page, page_size=10, since=since)
+        # The first page tells us how many pages there are; the rest are fetched concurrently
+        first_page = self.get_workout_events(page=1, page_size=10, since=since)
+        pages = [first_page]
+        page_count = first_page.get("page_count", 1)
+        if first_page.get("events") and page_count > 1:
+            with ThreadPoolExecutor(max_workers=HEVY_FETCH_WORKERS) as executor:
+                pages += executor.map(
+                    lambda page: self.get_workout_events(page=page, page_size=10, since=since),
+                    range(2, page_count + 1)
+                )
+        
+        # Collect in page order, stopping at the first empty page
+        for page, data in enumerate(pages, start=1):
             events = data.get("events", [])
             
             if not events:
@@ -1600,12 +2225,6 @@ class HevyStatsClient:
                 
             all_events.extend(events)
             print(f"   📄 Page {page}: {len(events)} events")
-            
-            # Check if we've reached the last page
-            if page >= data.get("page_count", 1):
-                break
-                
-            page += 1
         
         print(f"✅ Total events fetched: {len(all_events)}")
         return all_events
@@ -1623,17 +2242,25 @@ class HevyStatsClient:
         if isinstance(data, dict):
             cleaned = {}
             for key, value in data.items():
-                if value is not None:
-                    cleaned_value = self.clean_null_values(value)
-                    if cleaned_value is not None and cleaned_value != {} and cleaned_value != []:
-                        cleaned[key] = cleaned_value
+                if value is None:
+                    continue
+                # Only containers need recursing into, and only they can end up empty
+                if isinstance(value, (dict, list)):
+                    value = self.clean_null_values(value)
+                    if not value:
+                        continue
+                cleaned[key] = value
             return cleaned
         elif isinstance(data, list):
             cleaned = []
             for item in data:
-                cleaned_item = self.clean_null_values(item)
-                if cleaned_item is not None and cleaned_item != {} and cleaned_item != []:
-                    cleaned.append(cleaned_item)
+                if item is None:
+                    continue
+                if isinstance(item, (dict, list)):
+                    item = self.clean_null_values(item)
+                    if not item:
+                        continue
+                cleaned.append(item)
             return cleaned
         else:
             return data
@@ -1652,9 +2279,9 @@ def filter_recent_data(df: pd.DataFrame, days: int = 90) -> pd.DataFrame:
     if len(df) == 0:
         return df
     
-    # Ensure date column is datetime
-    df = df.copy()
-    df["date"] = pd.to_datetime(df["date"])
+    # Ensure date column is datetime (converted into a new frame only when it is not already)
+    if not pd.api.types.is_datetime64_any_dtype(df["date"]):
+        df = df.assign(date=pd.to_datetime(df["date"]))
     
     # Calculate cutoff date
     cutoff_date = datetime.now() - timedelta(days=days)
@@ -1666,6 +2293,22 @@ def filter_recent_data(df: pd.DataFrame, days: int = 90) -> pd.DataFrame:
     
     return recent_df
 
+# Exercises to exclude from analysis, lowercased once for case-insensitive matching
+EXCLUDED_EXERCISES = [
+    "Warm Up",
+    "Treadmill",
+    "Walking", 
+    "Running",
+    "Elliptical",
+    "Bike",
+    "Stair Climber",
+    "Rest",
+    "Stretching",
+    "Meditation",
+    "Cardio"
+]
+EXCLUDED_EXERCISES_LOWER = frozenset(ex.lower() for ex in EXCLUDED_EXERCISES)
+
 def filter_excluded_exercises(df: pd.DataFrame) -> pd.DataFrame:
     """
     Filter out exercises that should be ignored from analysis.
@@ -1679,28 +2322,13 @@ def filter_excluded_exercises(df: pd.DataFrame) -> pd.DataFrame:
     if len(df) == 0:
         return df
     
-    # List of exercises to exclude from analysis
-    EXCLUDED_EXERCISES = [
-        "Warm Up",
-        "Treadmill",
-        "Walking", 
-        "Running",
-        "Elliptical",
-        "Bike",
-        "Stair Climber",
-        "Rest",
-        "Stretching",
-        "Meditation",
-        "Cardio"
-    ]
-    
     original_count = len(df)
     
-    # Filter out excluded exercises (case-insensitive)
-    df_filtered = df[~df["exercise"].str.lower().isin([ex.lower() for ex in EXCLUDED_EXERCISES])]
+    # Filter out excluded exercises (case-insensitive), matching each distinct name once
+    excluded_exercises = [name for name in df["exercise"].unique() if name.lower() in EXCLUDED_EXERCISES_LOWER]
+    df_filtered = df[~df["exercise"].isin(excluded_exercises)]
     
     excluded_count = original_count - len(df_filtered)
-    excluded_exercises = df[df["exercise"].str.lower().isin([ex.lower() for ex in EXCLUDED_EXERCISES])]["exercise"].unique()
     
     if excluded_count > 0:
         print(f"🚫 Excluded {excluded_count} sets from {len(excluded_exercises)} exercise types: {', '.join(excluded_exercises)}")
@@ -1718,22 +2346,31 @@ def events_to_df(events_file: str) -> pd.DataFrame:
         DataFrame with flattened workout data
     """
     try:
-        with open(events_file, 'r') as f:
-            events = json.load(f)
+        if ORJSON_AVAILABLE:
+            with open(events_file, 'rb') as f:
+                events = orjson.loads(f.read())
+        else:
+            with open(events_file, 'r') as f:
+                events = json.load(f)
     except FileNotFoundError:
         print(f"❌ Error: File {events_file} not found")
         sys.exit(1)
-    except json.JSONDecodeError:
+    except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses this too
         print(f"❌ Error: Invalid JSON in {events_file}")
         sys.exit(1)
     
+    # One plain tuple per set (no per-set dict), transposed into columns once at the end
+    column_names = (
+        "date", "workout", "exercise", "exercise_notes", "weight", "reps", "rpe",
+        "duration_seconds", "distance_meters", "set_index"
+    )
     rows = []
     for event in events:
         if event.get("type") != "updated":
             continue
             
         workout = event.get("workout", {})
-        workout_date = datetime.fromisoformat(workout.get("start_time", "").replace('Z', '+00:00'))
+        workout_date = datetime.fromisoformat(workout.get("start_time", "").replace('Z', '+00:00')).date()
         workout_title = workout.get("title", "Untitled Workout")
         
         for exercise in workout.get("exercises", []):
@@ -1743,23 +2380,36 @@ def events_to_df(events_file: str) -> pd.DataFrame:
             for set_data in exercise.get("sets", []):
                 if set_data.get("type") != "normal":  # Skip warm-ups, drop sets, etc.
                     continue
-                    
-                rows.append({
-                    "date": workout_date.date(),
-                    "workout": workout_title,
-                    "exercise": exercise_title,
-                    "exercise_notes": exercise_notes,
-                    "weight": set_data.get("weight_kg", 0.0) or 0.0,
-                    "reps": set_data.get("reps", 0) or 0,
-                    "rpe": set_data.get("rpe"),
-                    "duration_seconds": set_data.get("duration_seconds"),
-                    "distance_meters": set_data.get("distance_meters"),
-                    "set_index": set_data.get("index", 0)
-                })
-    
-    df = pd.DataFrame(rows)
+                
+                rows.append((
+                    workout_date,
+                    workout_title,
+                    exercise_title,
+                    exercise_notes,
+                    set_data.get("weight_kg", 0.0) or 0.0,
+                    set_data.get("reps", 0) or 0,
+                    set_data.get("rpe"),
+                    set_data.get("duration_seconds"),
+                    set_data.get("distance_meters"),
+                    set_data.get("index", 0)
+                ))
+    
+    if rows:
+        df = pd.DataFrame(dict(zip(column_names, map(list, zip(*rows)))))
+    else:
+        df = pd.DataFrame()
     if len(df) > 0:
+        # Parse dates once at ingest (repeated dates are converted once via to_datetime's cache)
+        df["date"] = pd.to_datetime(df["date"])
         df = df.sort_values(["date", "exercise", "set_index"])
+        # Titles and notes repeat on every set - store them as category codes; counts fit in int16 and the
+        # optional cardio fields become float columns instead of boxed objects (weight/rpe stay float64 so
+        # means and exported values are unchanged)
+        df = df.astype({
+            "workout": "category", "exercise_notes": "category",
+            "reps": "int16", "set_index": "int16",
+            "duration_seconds": "float64", "distance_meters": "float64"
+        })
     
     print(f"📊 Converted {len(df)} sets from {len(events)} events")
     return df
@@ -1777,20 +2427,14 @@ def latest_session_stats(df: pd.DataFrame) -> pd.DataFrame:
     if len(df) == 0:
         return pd.DataFrame()
     
-    # Get the most recent date for each exercise
-    latest_dates = df.groupby("exercise")["date"].max()
-    
-    # Filter to only include sets from the latest session of each exercise
-    latest_rows = []
-    for exercise, latest_date in latest_dates.items():
-        exercise_latest = df[(df["exercise"] == exercise) & (df["date"] == latest_date)]
-        latest_rows.append(exercise_latest)
+    # Filter to only include sets from the latest session of each exercise,
+    # comparing every row against its exercise's most recent date in one mask
+    latest_dates = df.groupby("exercise")["date"].transform("max")
+    latest_df = df[df["date"] == latest_dates]
     
-    if not latest_rows:
+    if len(latest_df) == 0:
         return pd.DataFrame()
     
-    latest_df = pd.concat(latest_rows, ignore_index=True)
-    
     # Calculate stats per exercise
     stats = latest_df.groupby("exercise").agg({
         "date": "max",
@@ -1807,6 +2451,27 @@ def latest_session_stats(df: pd.DataFrame) -> pd.DataFrame:
     
     return stats
 
+def iso_week_numbers(dates: pd.Series) -> pd.Series:
+    """
+    ISO 8601 week number of each date, computed with integer day arithmetic.
+    
+    Args:
+        dates: Dates (datetime.date objects, datetimes or ISO strings)
+    
+    Returns:
+        UInt32 Series of week numbers aligned with dates (<NA> where the date is missing)
+    """
+    day_values = np.asarray(dates, dtype="datetime64[D]")
+    valid = ~np.isnat(day_values)
+    days = np.where(valid, day_values.astype(np.int64), 0)
+    
+    # An ISO week belongs to the year of its Thursday; day 0 (1970-01-01) was a Thursday
+    thursday = days - (days + 3) % 7 + 3
+    year_start = thursday.astype("datetime64[D]").astype("datetime64[Y]").astype("datetime64[D]").astype(np.int64)
+    weeks = ((thursday - year_start) // 7 + 1).astype(np.uint32)
+    
+    return pd.Series(pd.arrays.IntegerArray(weeks, ~valid), index=dates.index, name="week")
+
 def get_30_day_overview(df: pd.DataFrame) -> Dict:
     """
     Get overview statistics for the past 30 days.
@@ -1839,14 +2504,17 @@ def get_30_day_overview(df: pd.DataFrame) -> Dict:
     top_by_frequency = exercise_stats.nlargest(5, "sessions")
     top_by_volume = exercise_stats.nlargest(5, "total_volume")
     
-    # Weekly breakdown
-    df_with_week = df.copy()
-    df_with_week["date"] = pd.to_datetime(df_with_week["date"])
-    df_with_week["week"] = df_with_week["date"].dt.isocalendar().week
+    # Weekly breakdown, bucketed by ISO week number without copying the whole frame
+    df_with_week = pd.DataFrame({
+        "week": iso_week_numbers(df["date"]),
+        "workout": df["workout"],
+        "reps": df["reps"],
+        "volume": df["weight"] * df["reps"]
+    })
     weekly_stats = df_with_week.groupby("week").agg({
         "workout": "nunique",
         "reps": "sum",
-        "weight": lambda x: (x * df_with_week.loc[x.index, "reps"]).sum()
+        "volume": "sum"
     }).round(1)
     weekly_stats.columns = ["workouts", "total_reps", "total_volume"]
     
@@ -1875,20 +2543,13 @@ def get_realistic_weight_recommendation(current_weight: float, target_change_pct
     # Calculate ideal target weight
     ideal_weight = current_weight * target_change_pct
     
-    # Infer equipment increment from actual weights used
-    weights_used = [s["weight"] for s in sets_data if s["weight"] > 0]
-    
-    # Determine increment pattern
-    increment = 2.5  # Default assumption for machines
-    
-    if len(weights_used) >= 2:
-        # Look for common increments in the data
-        unique_weights = sorted(set(weights_used))
-        if len(unique_weights) >= 2:
-            diffs = [unique_weights[i+1] - unique_weights[i] for i in range(len(unique_weights)-1)]
-            common_increments = [d for d in diffs if d > 0 and d <= 10]  # Reasonable range
-            if common_increments:
-                increment = min(common_increments)  # Use smallest observed increment
+    # Infer equipment increment from actual weights used: the smallest step between
+    # distinct weights, within a reasonable range (sorted distinct weights always step up)
+    unique_weights = sorted({s["weight"] for s in sets_data if s["weight"] > 0})
+    increment = min(
+        (heavier - lighter for lighter, heavier in zip(unique_weights, unique_weights[1:]) if heavier - lighter <= 10),
+        default=2.5  # Default assumption for machines
+    )
     
     # Round to nearest realistic increment
     if increment >= 2.5:
@@ -1907,6 +2568,22 @@ def get_realistic_weight_recommendation(current_weight: float, target_change_pct
     
     return max(0, realistic_weight)  # Don't go below 0
 
+def _nan_mean(values: np.ndarray) -> float:
+    """
+    Mean of a float array ignoring NaNs, matching pandas Series.mean() without its dispatch overhead.
+    
+    Args:
+        values: Float array of set values
+    
+    Returns:
+        Mean of the non-NaN values, or NaN when there are none
+    """
+    mask = ~np.isnan(values)
+    count = mask.sum()
+    if count == 0:
+        return np.nan
+    return np.where(mask, values, 0.0).sum() / count
+
 def get_last_session_only(df: pd.DataFrame) -> Dict:
     """
     Get detailed breakdown of ONLY the most recent workout session (single date).
@@ -1940,24 +2617,30 @@ def get_last_session_only(df: pd.DataFrame) -> Dict:
     for exercise, exercise_data in latest_session.groupby("exercise"):
         sets_data = []
         total_volume = 0
-        rpe_values = []
         
-        for _, row in exercise_data.iterrows():
-            set_volume = (row["weight"] * row["reps"]) if row["weight"] > 0 else 0
+        # Pull each set column out once as a float array for the averages and RPE filter
+        weight_array = exercise_data["weight"].to_numpy(dtype=float)
+        reps_array = exercise_data["reps"].to_numpy(dtype=float)
+        rpe_array = exercise_data["rpe"].to_numpy(dtype=float)
+        
+        # Logged RPE values (not missing or 0) in set order, filtered in one array pass
+        rpe_values = rpe_array[~np.isnan(rpe_array) & (rpe_array != 0)].tolist()
+        
+        # Walk the set columns as plain Python values (no per-row Series like iterrows)
+        for weight, reps, rpe in zip(exercise_data["weight"].tolist(), exercise_data["reps"].tolist(), exercise_data["rpe"].tolist()):
+            set_volume = (weight * reps) if weight > 0 else 0
             total_volume += set_volume
             sets_data.append({
-                "weight": row["weight"],
-                "reps": row["reps"],
-                "rpe": row["rpe"],
+                "weight": weight,
+                "reps": reps,
+                "rpe": rpe,
                 "volume": set_volume
             })
-            if row["rpe"] and not pd.isna(row["rpe"]):
-                rpe_values.append(row["rpe"])
         
         rep_range = REP_RANGE.get(exercise, None)
-        avg_reps = exercise_data["reps"].mean()
-        avg_weight = exercise_data["weight"].mean()
-        avg_rpe = exercise_data["rpe"].mean()
+        avg_reps = _nan_mean(reps_array)
+        avg_weight = _nan_mean(weight_array)
+        avg_rpe = _nan_mean(rpe_array)
         
         # Get peak (highest) and final set RPE for better analysis
         peak_rpe = max(rpe_values) if rpe_values else None
@@ -1971,8 +2654,8 @@ def get_last_session_only(df: pd.DataFrame) -> Dict:
             verdict = "❓ no target"
             suggestion = "add rep target to rep_rules.py"
         else:
-            # First check RPE if available (RPE takes priority)
-            if peak_rpe and not pd.isna(peak_rpe):
+            # First check RPE if available (RPE takes priority); rpe_values already excludes NaN
+            if peak_rpe:
                 if peak_rpe >= 9.5:
                     verdict = "⬇️ too heavy"
                     if is_assisted:
@@ -2071,12 +2754,87 @@ def get_last_session_only(df: pd.DataFrame) -> Dict:
     
     return workout_info
 
-def print_comprehensive_report(df: pd.DataFrame):
+def _prune_cache_dir(directory: str, max_age: float):
+    """Delete cache files under a directory that were last written more than max_age seconds ago (best effort)."""
+    cutoff = time.time() - max_age
+    for root, _, files in os.walk(directory):
+        for name in files:
+            path = os.path.join(root, name)
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+            except OSError:
+                pass
+
+@lru_cache(maxsize=1)
+def _analysis_code_digest() -> str:
+    """Digest of the analysis code and rep rules, so edits to either invalidate cached analyses."""
+    digest = hashlib.sha256()
+    for module_file in (__file__, sys.modules["rep_rules"].__file__):
+        with open(module_file, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+def compute_report_analyses(df: pd.DataFrame, use_cache: bool = True) -> Dict:
+    """
+    Compute the date-independent analyses behind the comprehensive report, reusing cached results.
+    
+    Args:
+        df: Full workout DataFrame
+        use_cache: Reuse and store cached analyses (also off when HEVY_ANALYSIS_CACHE=false)
+    
+    Returns:
+        Dictionary with progression_data, last_session, session_quality, periodization,
+        exercise_evolution and comprehensive_trends
+    """
+    key = None
+    if use_cache and ANALYSIS_CACHE_ENABLED:
+        content = hashlib.sha256(_analysis_code_digest().encode("utf-8"))
+        content.update(repr([(str(column), str(dtype)) for column, dtype in df.dtypes.items()]).encode("utf-8"))
+        content.update(pd.util.hash_pandas_object(df).to_numpy().tobytes())
+        key = content.hexdigest()
+        path = os.path.join(ANALYSIS_CACHE_DIR, f"{key}.pkl")
+        
+        try:
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except Exception:
+            pass  # not cached yet, or unreadable (e.g. written by another pandas version) - recomputed below
+    
+    progression_data = get_exercise_progression(df)
+    last_session = get_last_session_only(df)
+    analyses = {
+        "progression_data": progression_data,
+        "last_session": last_session,
+        "session_quality": calculate_session_quality(last_session, progression_data),
+        "periodization": detect_plateaus_and_periodization(progression_data),
+        "exercise_evolution": analyze_exercise_evolution(df),
+        "comprehensive_trends": get_comprehensive_trends(df)
+    }
+    
+    if key is not None:
+        try:
+            os.makedirs(ANALYSIS_CACHE_DIR, exist_ok=True)
+            with open(path, 'wb') as f:
+                pickle.dump(analyses, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass  # cache is best effort
+        _prune_cache_dir(ANALYSIS_CACHE_DIR, ANALYSIS_CACHE_TTL)
+    
+    return analyses
+
+def _weight_change_line(exercise: str, rec: Dict) -> str:
+    """Report bullet for a suggested weight increase or decrease."""
+    return f"   • **{exercise}**: {rec['current_weight']:.1f}kg → {rec['suggested_weight']:.1f}kg ({rec['reasoning']})"
+
+def print_comprehensive_report(df: pd.DataFrame, use_cache: bool = True, refresh_routines: bool = False):
     """
     Print a comprehensive report with clear separation of 30-day trends and last session.
     
     Args:
         df: Full workout DataFrame
+        use_cache: Reuse cached analyses and AI coaching answers (False for --no-cache)
+        refresh_routines: Re-fetch routine templates instead of using the hourly cache (--refresh-routines)
     """
     print("\n" + "="*80)
     print("🏋️‍♂️  HEVY COMPREHENSIVE COACHING REPORT")
@@ -2087,25 +2845,38 @@ def print_comprehensive_report(df: pd.DataFrame):
         return
     
     # Initialize AI coach
-    ai_coach = AICoach()
-    
-    # Calculate all the new metrics
-    progression_data = get_exercise_progression(df)
-    last_session = get_last_session_only(df)
-    session_quality = calculate_session_quality(last_session, progression_data)
-    periodization = detect_plateaus_and_periodization(progression_data)
+    ai_coach = AICoach(use_cache=use_cache)
+    
+    # Calculate all the new metrics (reused from the analysis cache when the data is unchanged)
+    analyses = compute_report_analyses(df, use_cache=use_cache)
+    progression_data = analyses["progression_data"]
+    last_session = analyses["last_session"]
+    session_quality = analyses["session_quality"]
+    periodization = analyses["periodization"]
+    exercise_evolution = analyses["exercise_evolution"]
+    comprehensive_trends = analyses["comprehensive_trends"]
+    # Recovery status depends on today's date, so it is always recomputed
     volume_recovery = get_volume_recovery_insights(df)
-    exercise_evolution = analyze_exercise_evolution(df)
-    comprehensive_trends = get_comprehensive_trends(df)
     
     # Get cyclical routine information for AI context
     next_workout_info = {}
+    routine_recommendations = {}
+    workout_cycle = None
     if api_key := os.getenv("HEVY_API_KEY"):
         workout_cycle = WorkoutCycle(api_key)
         if workout_cycle.is_available():
             # Use unfiltered data for cycle detection (includes treadmill/cardio for rest day detection)
             df_with_cardio = filter_recent_data(events_to_df("hevy_events.json"), 90)
-            next_workout_info = workout_cycle.get_next_workout_info(df_with_cardio)
+            next_workout_info = workout_cycle.get_next_workout_info(df_with_cardio, refresh_routines=refresh_routines)
+            if next_workout_info and "error" not in next_workout_info and not next_workout_info["is_rest_day"]:
+                routine_recommendations = workout_cycle.get_routine_specific_recommendations(df, next_workout_info)
+    
+    # Fetch all AI coaching prompts up front (concurrently, or as one batch job)
+    if ai_coach.is_available():
+        ai_coach.prefetch_report_insights(
+            session_quality, last_session, progression_data, periodization,
+            comprehensive_trends, next_workout_info, volume_recovery, routine_recommendations
+        )
     
     # 🚀 QUICK SUMMARY - Mobile-friendly, action-focused
     print("\n" + "🚀 QUICK SUMMARY".center(80))
@@ -2237,9 +3008,8 @@ def print_comprehensive_report(df: pd.DataFrame):
         if periodization["deload_candidates"]:
             print(f"\n🔄 **Deload Candidates**: {', '.join(periodization['deload_candidates'][:3])}")
     
-    # 🔄 CYCLICAL ROUTINE TRACKING
-    if api_key := os.getenv("HEVY_API_KEY"):
-        workout_cycle = WorkoutCycle(api_key)
+    # 🔄 CYCLICAL ROUTINE TRACKING (reuses the WorkoutCycle and its HTTP session from above)
+    if workout_cycle is not None:
         if workout_cycle.is_available():
             print(f"\n🔄 **CYCLICAL ROUTINE TRACKING**")
             print("-" * 50)
@@ -2250,7 +3020,7 @@ def print_comprehensive_report(df: pd.DataFrame):
                 print(f"📊 **Days Until Repeat**: {next_workout_info['days_until_same_workout']}")
                 
                 if not next_workout_info["is_rest_day"]:
-                    recommendations = workout_cycle.get_routine_specific_recommendations(df, next_workout_info)
+                    recommendations = routine_recommendations
                     if recommendations["type"] == "workout_specific":
                         exercise_recs = recommendations["exercise_recommendations"]
                         if exercise_recs:
@@ -2270,29 +3040,33 @@ def print_comprehensive_report(df: pd.DataFrame):
                                 else:
                                     maintains.append((exercise, rec))
                             
-                            # Show increases
+                            # Show increases (each section is formatted up front and printed in one call)
                             if increases:
-                                print(f"\n📈 **Suggested Increases**:")
-                                for exercise, rec in increases:
-                                    print(f"   • **{exercise}**: {rec['current_weight']:.1f}kg → {rec['suggested_weight']:.1f}kg ({rec['reasoning']})")
+                                print("\n".join(
+                                    ["\n📈 **Suggested Increases**:"] +
+                                    [_weight_change_line(exercise, rec) for exercise, rec in increases]
+                                ))
                             
                             # Show decreases  
                             if decreases:
-                                print(f"\n📉 **Suggested Decreases**:")
-                                for exercise, rec in decreases:
-                                    print(f"   • **{exercise}**: {rec['current_weight']:.1f}kg → {rec['suggested_weight']:.1f}kg ({rec['reasoning']})")
+                                print("\n".join(
+                                    ["\n📉 **Suggested Decreases**:"] +
+                                    [_weight_change_line(exercise, rec) for exercise, rec in decreases]
+                                ))
                             
                             # Show maintains
                             if maintains:
-                                print(f"\n✅ **Maintain Current Weights**:")
-                                for exercise, rec in maintains:
-                                    print(f"   • **{exercise}**: Keep {rec['current_weight']:.1f}kg ({rec['reasoning']})")
+                                print("\n".join(
+                                    ["\n✅ **Maintain Current Weights**:"] +
+                                    [f"   • **{exercise}**: Keep {rec['current_weight']:.1f}kg ({rec['reasoning']})" for exercise, rec in maintains]
+                                ))
                             
                             # Show general recommendations
                             if recommendations.get("general_recommendations"):
-                                print(f"\n💡 **General Recommendations**:")
-                                for rec in recommendations["general_recommendations"]:
-                                    print(f"   • {rec}")
+                                print("\n".join(
+                                    ["\n💡 **General Recommendations**:"] +
+                                    [f"   • {rec}" for rec in recommendations["general_recommendations"]]
+                                ))
                         
                         # Add AI insights as supplement to structured recommendations
                         if ai_coach.is_available():
@@ -2371,12 +3145,9 @@ def print_comprehensive_report(df: pd.DataFrame):
         # Exercise trends summary
         exercise_trends = comprehensive_trends.get("exercise_trends", {})
         if exercise_trends:
-            growth_categories = {}
+            growth_categories = defaultdict(list)  # statuses keep first-seen order
             for exercise, data in exercise_trends.items():
-                status = data["growth_status"]
-                if status not in growth_categories:
-                    growth_categories[status] = []
-                growth_categories[status].append(exercise)
+                growth_categories[data["growth_status"]].append(exercise)
             
             print(f"\n📊 **Exercise Growth Summary**:")
             for status, exercises in growth_categories.items():
@@ -2444,28 +3215,17 @@ def export_recent_workouts(df: pd.DataFrame, days: int = 30) -> str:
         print(f"❌ No workout data found in the last {days} days")
         return ""
     
-    # Create export-friendly DataFrame
-    export_df = df_recent.copy()
-    export_df["date"] = pd.to_datetime(export_df["date"]).dt.strftime("%Y-%m-%d")
-    
-    # Calculate additional useful columns
-    export_df["volume"] = export_df["weight"] * export_df["reps"]
-    export_df["weight_kg"] = export_df["weight"]  # Explicit unit clarity
-    
-    # Reorder and rename columns for clarity
-    export_columns = {
-        "date": "Date",
-        "workout": "Workout_Name", 
-        "exercise": "Exercise",
-        "weight_kg": "Weight_kg",
-        "reps": "Reps",
-        "rpe": "RPE",
-        "volume": "Volume_kg",
-        "exercise_notes": "Exercise_Notes"
-    }
-    
-    # Select and rename columns
-    export_df = export_df[list(export_columns.keys())].rename(columns=export_columns)
+    # Build the export-friendly DataFrame straight from the needed columns (no full-frame copy)
+    export_df = pd.DataFrame({
+        "Date": df_recent["date"].dt.strftime("%Y-%m-%d"),  # already datetime via filter_recent_data
+        "Workout_Name": df_recent["workout"],
+        "Exercise": df_recent["exercise"],
+        "Weight_kg": df_recent["weight"],  # Explicit unit clarity
+        "Reps": df_recent["reps"],
+        "RPE": df_recent["rpe"],
+        "Volume_kg": df_recent["weight"] * df_recent["reps"],
+        "Exercise_Notes": df_recent["exercise_notes"]
+    })
     
     # Sort by date and exercise for readability
     export_df = export_df.sort_values(["Date", "Exercise", "Weight_kg"])
@@ -2481,7 +3241,7 @@ def export_recent_workouts(df: pd.DataFrame, days: int = 30) -> str:
     total_sets = len(export_df)
     total_workouts = export_df["Date"].nunique()
     total_exercises = export_df["Exercise"].nunique()
-    date_range = (export_df["Date"].min(), export_df["Date"].max())
+    date_range = (export_df["Date"].iat[0], export_df["Date"].iat[-1])  # sorted by Date above
     total_volume = export_df["Volume_kg"].sum()
     
     print(f"\n📊 **WORKOUT DATA EXPORT**")
@@ -2502,30 +3262,47 @@ def export_recent_workouts(df: pd.DataFrame, days: int = 30) -> str:
     
     return filename
 
-def save_report_to_markdown(df: pd.DataFrame) -> str:
+def capture_comprehensive_report(df: pd.DataFrame, use_cache: bool = True, refresh_routines: bool = False) -> str:
     """
-    Save the comprehensive report to a markdown file.
+    Generate the comprehensive report and return it as text instead of printing it.
     
     Args:
         df: Full workout DataFrame
+        use_cache: Reuse cached analyses and AI coaching answers
+        refresh_routines: Re-fetch routine templates instead of using the hourly cache
     
     Returns:
-        Filename of the saved markdown file
+        Report text exactly as print_comprehensive_report would print it
     """
     import io
     from contextlib import redirect_stdout
     
-    # Capture the report output
     markdown_content = io.StringIO()
     with redirect_stdout(markdown_content):
-        print_comprehensive_report(df)
+        print_comprehensive_report(df, use_cache=use_cache, refresh_routines=refresh_routines)
+    
+    return markdown_content.getvalue()
+
+def save_report_to_markdown(df: pd.DataFrame, report_content: Optional[str] = None) -> str:
+    """
+    Save the comprehensive report to a markdown file.
+    
+    Args:
+        df: Full workout DataFrame
+        report_content: Already generated report text (generated from df if not provided)
+    
+    Returns:
+        Filename of the saved markdown file
+    """
+    if report_content is None:
+        report_content = capture_comprehensive_report(df)
     
     # Save to file
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"hevy_coaching_report_{timestamp}.md"
     
     with open(filename, 'w') as f:
-        f.write(markdown_content.getvalue())
+        f.write(report_content)
     
     return filename
 
@@ -2544,23 +3321,34 @@ def get_exercise_progression(df: pd.DataFrame) -> Dict:
     
     progression_data = {}
     
+    # Set columns as arrays, with per-set volume computed once for the whole frame
+    weight_array = df["weight"].to_numpy(dtype=float)
+    reps_array = df["reps"].to_numpy(dtype=float)
+    rpe_array = df["rpe"].to_numpy(dtype=float)
+    volume_array = (df["weight"] * df["reps"]).to_numpy()
+    
+    # Row positions of every (exercise, date) session from a single groupby pass
+    session_positions = defaultdict(dict)
+    for (exercise, date), positions in df.groupby(["exercise", "date"]).indices.items():
+        session_positions[exercise][date] = positions
+    
     for exercise in df["exercise"].unique():
-        exercise_df = df[df["exercise"] == exercise].copy()
+        exercise_sessions = session_positions.get(exercise, {})
         
         # Get unique session dates for this exercise
-        session_dates = sorted(exercise_df["date"].unique(), reverse=True)
+        session_dates = sorted(exercise_sessions, reverse=True)
         
         if len(session_dates) < 2:
             continue  # Need at least 2 sessions to track progression
         
         sessions = []
         for i, date in enumerate(session_dates[:4]):  # Last 4 sessions max
-            session_data = exercise_df[exercise_df["date"] == date]
+            positions = exercise_sessions[date]
             
-            avg_weight = session_data["weight"].mean()
-            avg_reps = session_data["reps"].mean()
-            avg_rpe = session_data["rpe"].mean()
-            total_volume = (session_data["weight"] * session_data["reps"]).sum()
+            avg_weight = _nan_mean(weight_array[positions])
+            avg_reps = _nan_mean(reps_array[positions])
+            avg_rpe = _nan_mean(rpe_array[positions])
+            total_volume = np.nansum(volume_array[positions])
             
             sessions.append({
                 "date": date,
@@ -2569,7 +3357,7 @@ def get_exercise_progression(df: pd.DataFrame) -> Dict:
                 "avg_reps": avg_reps,
                 "avg_rpe": avg_rpe,
                 "total_volume": total_volume,
-                "sets": len(session_data)
+                "sets": len(positions)
             })
         
         # Calculate progression metrics
@@ -2634,13 +3422,12 @@ def calculate_session_quality(last_session: Dict, progression_data: Dict) -> Dic
     progression_scores = []
     
     for exercise in last_session["exercises"]:
-        exercise_name = exercise["name"]
-        
         # RPE quality using peak RPE (7.5-9.0 is ideal range)
         peak_rpe = exercise.get("peak_rpe")
         final_rpe = exercise.get("final_rpe")
         
-        if peak_rpe and not pd.isna(peak_rpe):
+        # peak_rpe == peak_rpe is the plain-float NaN check, without pd.isna's per-call dispatch
+        if peak_rpe and peak_rpe == peak_rpe:
             if 7.5 <= peak_rpe <= 9.0:
                 rpe_score = 100  # Perfect RPE range
             elif final_rpe and final_rpe >= 9.0 and peak_rpe <= 9.5:
@@ -2658,23 +3445,24 @@ def calculate_session_quality(last_session: Dict, progression_data: Dict) -> Dic
             rpe_scores.append(rpe_score)
         
         # Enhanced progression quality assessment with RPE context
-        if exercise_name in progression_data:
-            prog_data = progression_data[exercise_name]
-            
+        prog_data = progression_data.get(exercise["name"])
+        if prog_data is not None:
             # Get previous session's RPE if available
             previous_rpe = None
-            if len(prog_data["sessions"]) >= 2:
-                previous_session = prog_data["sessions"][1]  # Previous session (sessions[0] is current)
+            sessions = prog_data["sessions"]
+            if len(sessions) >= 2:
+                previous_session = sessions[1]  # Previous session (sessions[0] is current)
                 previous_rpe = previous_session.get("avg_rpe")
             
-            if prog_data["weight_change"] > 0:
+            weight_change = prog_data["weight_change"]
+            if weight_change > 0:
                 # Weight increased
                 progressed += 1
                 if previous_rpe and previous_rpe <= 7.5:
                     progression_scores.append(100)  # Good increase from low RPE
                 else:
                     progression_scores.append(90)   # Increase but unsure about RPE context
-            elif prog_data["weight_change"] == 0:
+            elif weight_change == 0:
                 # Weight maintained
                 if prog_data["is_stagnant"]:
                     progression_scores.append(60)  # Stagnant
@@ -2783,21 +3571,15 @@ def detect_plateaus_and_periodization(progression_data: Dict) -> Dict:
             # Look for high RPE sessions that might justify the weight decrease
             high_rpe_detected = False
             if len(sessions) >= 2:
-                # Check if any recent session had high RPE (>=9.5)
-                for session in sessions[:3]:  # Check last 3 sessions
-                    session_rpe = session.get("avg_rpe")
-                    if session_rpe and session_rpe >= 9.5:
-                        high_rpe_detected = True
-                        break
-                
-                # Also check if there was a concerning RPE trend
+                # Logged RPEs of the last 3 sessions in one pass (rpe == rpe skips NaN without pd.isna)
                 rpe_values = []
                 for session in sessions[:3]:
-                    if session.get("avg_rpe") and not pd.isna(session.get("avg_rpe")):
-                        rpe_values.append(session["avg_rpe"])
+                    session_rpe = session.get("avg_rpe")
+                    if session_rpe and session_rpe == session_rpe:
+                        rpe_values.append(session_rpe)
                 
-                # If average RPE over recent sessions was >9.0, justify the decrease
-                if rpe_values and sum(rpe_values) / len(rpe_values) >= 9.0:
+                # Any recent session at high RPE (>=9.5), or an average over 9.0, justifies the decrease
+                if rpe_values and (max(rpe_values) >= 9.5 or sum(rpe_values) / len(rpe_values) >= 9.0):
                     high_rpe_detected = True
             
             if high_rpe_detected:
@@ -2841,6 +3623,18 @@ def detect_plateaus_and_periodization(progression_data: Dict) -> Dict:
         "total_exercises": total_exercises
     }
 
+# Exercise-name keywords per muscle group for the volume breakdown, compiled once
+MUSCLE_GROUP_KEYWORDS = {
+    "legs": ["leg press", "squat", "leg extension", "leg curl", "calf", "bulgarian"],
+    "chest": ["bench", "chest", "push-up", "dip"],
+    "back": ["row", "pull", "lat", "deadlift"],
+    "shoulders": ["shoulder", "press", "raise", "shrug"],
+    "arms": ["curl", "tricep", "bicep"]
+}
+MUSCLE_GROUP_PATTERNS = {
+    muscle: re.compile("|".join(keywords)) for muscle, keywords in MUSCLE_GROUP_KEYWORDS.items()
+}
+
 def get_volume_recovery_insights(df: pd.DataFrame) -> Dict:
     """
     Analyze volume trends and recovery indicators.
@@ -2854,10 +3648,14 @@ def get_volume_recovery_insights(df: pd.DataFrame) -> Dict:
     if len(df) == 0:
         return {}
     
-    df_copy = df.copy()
-    df_copy["date"] = pd.to_datetime(df_copy["date"])
-    df_copy["week"] = df_copy["date"].dt.isocalendar().week
-    df_copy["volume"] = df_copy["weight"] * df_copy["reps"]
+    # Only the columns this analysis reads (dates are parsed at ingest), not a full-frame copy
+    dates = pd.to_datetime(df["date"])
+    df_copy = pd.DataFrame({
+        "date": dates,
+        "exercise": df["exercise"],
+        "week": iso_week_numbers(dates),
+        "volume": df["weight"] * df["reps"]
+    })
     
     # Weekly volume analysis
     weekly_volume = df_copy.groupby("week")["volume"].sum().sort_index()
@@ -2881,34 +3679,25 @@ def get_volume_recovery_insights(df: pd.DataFrame) -> Dict:
             volume_trend = "decreasing moderately"
     
     # Recovery analysis
-    workout_dates = sorted(df_copy["date"].dt.date.unique())
+    # Sorted unique workout days as int64 day numbers (days since epoch)
+    workout_dates = np.unique(df_copy["date"].to_numpy().astype("datetime64[D]").astype(np.int64))
     
     if len(workout_dates) >= 2:
+        today = np.datetime64(datetime.now().date(), "D").astype(np.int64)
         last_workout = workout_dates[-1]
         previous_workout = workout_dates[-2]
-        days_since_last = (datetime.now().date() - last_workout).days
-        rest_between_last = (last_workout - previous_workout).days
+        days_since_last = int(today - last_workout)
+        rest_between_last = int(last_workout - previous_workout)
         
-        # Average rest between workouts
+        # Average rest between workouts - the consecutive gaps sum to the first-to-last span,
+        # so their mean needs no per-gap diff
         if len(workout_dates) >= 3:
-            rest_periods = []
-            for i in range(1, len(workout_dates)):
-                rest_periods.append((workout_dates[i] - workout_dates[i-1]).days)
-            avg_rest = sum(rest_periods) / len(rest_periods)
+            avg_rest = int(last_workout - workout_dates[0]) / (len(workout_dates) - 1)
         else:
             avg_rest = rest_between_last
         
         # Recovery status
-        if days_since_last <= 1:
-            recovery_status = "🔥 High frequency"
-        elif days_since_last <= 2:
-            recovery_status = "⚡ Good frequency"
-        elif days_since_last <= 4:
-            recovery_status = "✅ Optimal recovery"
-        elif days_since_last <= 7:
-            recovery_status = "😴 Extended rest"
-        else:
-            recovery_status = "🚨 Long break"
+        recovery_status = RECOVERY_LABELS[np.searchsorted(RECOVERY_BINS, days_since_last)]
     else:
         days_since_last = 0
         rest_between_last = 0
@@ -2916,19 +3705,17 @@ def get_volume_recovery_insights(df: pd.DataFrame) -> Dict:
         recovery_status = "📊 Insufficient data"
     
     # Body part volume breakdown
-    muscle_groups = {
-        "legs": ["leg press", "squat", "leg extension", "leg curl", "calf", "bulgarian"],
-        "chest": ["bench", "chest", "push-up", "dip"],
-        "back": ["row", "pull", "lat", "deadlift"],
-        "shoulders": ["shoulder", "press", "raise", "shrug"],
-        "arms": ["curl", "tricep", "bicep"]
-    }
+    # Match keywords against each distinct exercise name once, then map back to rows by code
+    exercise_codes, exercise_names = pd.factorize(df_copy["exercise"])
+    exercise_names_lower = [name.lower() for name in exercise_names]
     
     muscle_volume = {}
-    for muscle, keywords in muscle_groups.items():
-        muscle_df = df_copy[df_copy["exercise"].str.lower().str.contains("|".join(keywords), na=False)]
-        if len(muscle_df) > 0:
-            muscle_volume[muscle] = muscle_df["volume"].sum()
+    for muscle, pattern in MUSCLE_GROUP_PATTERNS.items():
+        # The precompiled pattern searched directly - a handful of names doesn't need the .str accessor
+        name_mask = np.array([pattern.search(name) is not None for name in exercise_names_lower], dtype=bool)
+        row_mask = (exercise_codes >= 0) & name_mask[exercise_codes]  # code -1 = missing name, never matches
+        if row_mask.any():
+            muscle_volume[muscle] = df_copy["volume"][row_mask].sum()
     
     return {
         "weekly_volume": weekly_volume,
@@ -2942,204 +3729,220 @@ def get_volume_recovery_insights(df: pd.DataFrame) -> Dict:
         "total_weekly_workouts": len(workout_dates)
     }
 
-def analyze_exercise_evolution(df: pd.DataFrame) -> Dict:
+def _analyze_single_exercise_evolution(exercise: str, exercise_df: pd.DataFrame) -> Optional[Dict]:
     """
-    Analyze the evolution of each exercise over multiple sessions, 
-    providing recommendations for past sessions and identifying missed opportunities.
+    Evolution analysis for one exercise (see analyze_exercise_evolution).
     
     Args:
-        df: DataFrame with workout data
+        exercise: Exercise name
+        exercise_df: Sets of this exercise only
     
     Returns:
-        Dictionary with exercise evolution analysis
+        Evolution data for the exercise (sessions as a list of dicts, newest first, with None
+        for missing RPEs), or None with fewer than 3 sessions
     """
-    if len(df) == 0:
-        return {}
+    # Row positions of each session date from a single groupby pass
+    session_positions = exercise_df.groupby("date").indices
     
-    # Get the absolute latest date across all exercises for reference
-    absolute_latest_date = df["date"].max()
+    # Get unique session dates for this exercise
+    session_dates = sorted(session_positions, reverse=True)
     
-    evolution_data = {}
+    if len(session_dates) < 3:  # Need at least 3 sessions for meaningful evolution analysis
+        return None
     
-    for exercise in df["exercise"].unique():
-        exercise_df = df[df["exercise"] == exercise].copy()
-        
-        # Get unique session dates for this exercise
-        session_dates = sorted(exercise_df["date"].unique(), reverse=True)
+    # Set columns as arrays, with per-set volume computed once
+    weight_array = exercise_df["weight"].to_numpy(dtype=float)
+    reps_array = exercise_df["reps"].to_numpy(dtype=float)
+    rpe_array = exercise_df["rpe"].to_numpy(dtype=float)
+    volume_array = (exercise_df["weight"] * exercise_df["reps"]).to_numpy()
+    rep_range = REP_RANGE.get(exercise, None)
+    
+    sessions_analysis = []
+    
+    for i, date in enumerate(session_dates[:5]):  # Analyze last 5 sessions max
+        positions = session_positions[date]
         
-        if len(session_dates) < 3:  # Need at least 3 sessions for meaningful evolution analysis
-            continue
+        avg_weight = _nan_mean(weight_array[positions])
+        avg_reps = _nan_mean(reps_array[positions])
+        avg_rpe = _nan_mean(rpe_array[positions])
+        total_volume = np.nansum(volume_array[positions])
         
-        sessions_analysis = []
+        # Get RPE values for this session (logged, i.e. not missing or 0, in set order)
+        session_rpes = rpe_array[positions]
+        rpe_values = session_rpes[~np.isnan(session_rpes) & (session_rpes != 0)].tolist()
+        peak_rpe = max(rpe_values) if rpe_values else None
+        final_rpe = rpe_values[-1] if rpe_values else None
         
-        for i, date in enumerate(session_dates[:5]):  # Analyze last 5 sessions max
-            session_data = exercise_df[exercise_df["date"] == date]
-            
-            avg_weight = session_data["weight"].mean()
-            avg_reps = session_data["reps"].mean()
-            avg_rpe = session_data["rpe"].mean()
-            total_volume = (session_data["weight"] * session_data["reps"]).sum()
-            
-            # Get RPE values for this session
-            rpe_values = [rpe for rpe in session_data["rpe"].values if rpe and not pd.isna(rpe)]
-            peak_rpe = max(rpe_values) if rpe_values else None
-            final_rpe = rpe_values[-1] if rpe_values else None
-            
-            # Determine the current session's performance verdict using RPE-focused logic
-            rep_range = REP_RANGE.get(exercise, None)
-            
-            if rep_range is None or rep_range[0] is None:
-                verdict = "❓ no target"
-            else:
-                # Prioritize RPE analysis
-                if peak_rpe and not pd.isna(peak_rpe):
-                    if peak_rpe >= 9.5:
-                        verdict = "⬇️ too heavy (RPE)"
-                    elif peak_rpe <= 7.0:
-                        verdict = "⬆️ too light (RPE)"
-                    elif final_rpe and final_rpe >= 9.0:
-                        # Final set at RPE 9+ means good progression to failure
-                        verdict = "✅ optimal"
-                    elif 7.5 <= peak_rpe <= 9.0:
-                        verdict = "✅ optimal"
-                    else:
-                        # Fall back to rep analysis with RPE context
-                        if avg_reps < rep_range[0]:
-                            verdict = "⬇️ too heavy"
-                        elif avg_reps > rep_range[1]:
-                            verdict = "⬆️ too light"
-                        else:
-                            verdict = "✅ in range"
+        # Determine the current session's performance verdict using RPE-focused logic
+        if rep_range is None or rep_range[0] is None:
+            verdict = "❓ no target"
+        else:
+            # Prioritize RPE analysis (peak_rpe comes from logged values, so it is never NaN)
+            if peak_rpe:
+                if peak_rpe >= 9.5:
+                    verdict = "⬇️ too heavy (RPE)"
+                elif peak_rpe <= 7.0:
+                    verdict = "⬆️ too light (RPE)"
+                elif final_rpe and final_rpe >= 9.0:
+                    # Final set at RPE 9+ means good progression to failure
+                    verdict = "✅ optimal"
+                elif 7.5 <= peak_rpe <= 9.0:
+                    verdict = "✅ optimal"
                 else:
-                    # No RPE data, use rep-based analysis
+                    # Fall back to rep analysis with RPE context
                     if avg_reps < rep_range[0]:
                         verdict = "⬇️ too heavy"
                     elif avg_reps > rep_range[1]:
                         verdict = "⬆️ too light"
                     else:
                         verdict = "✅ in range"
-            
-            sessions_analysis.append({
-                "date": date,
-                "session_ago": i,
-                "avg_weight": avg_weight,
-                "avg_reps": avg_reps,
-                "avg_rpe": avg_rpe,
-                "peak_rpe": peak_rpe,
-                "final_rpe": final_rpe,
-                "total_volume": total_volume,
-                "sets": len(session_data),
-                "verdict": verdict
-            })
-        
-        # Analyze decision quality: what actually happened vs what should have happened
-        missed_opportunities = []
-        good_decisions = []
-        
-        for i in range(len(sessions_analysis) - 1):
-            current = sessions_analysis[i]
-            previous = sessions_analysis[i + 1]
-            
-            weight_change = current["avg_weight"] - previous["avg_weight"]
-            
-            # What actually happened
-            if weight_change > 0.5:
-                actual_action = "increased"
-            elif weight_change < -0.5:
-                actual_action = "decreased"
             else:
-                actual_action = "maintained"
-            
-            # What should have happened based on previous session's verdict
-            if previous["verdict"] in ["⬇️ too heavy", "⬇️ too heavy (RPE)"]:
-                optimal_action = "decrease"
-            elif previous["verdict"] in ["⬆️ too light", "⬆️ too light (RPE)"]:
-                optimal_action = "increase"
-            elif previous["verdict"] in ["✅ optimal", "✅ in range"]:
-                # If previous session was optimal/good, maintaining or small increase is fine
-                optimal_action = "maintain"
-            else:  # "❓ no target"
-                optimal_action = "unknown"
-                continue  # Skip analysis if we don't have targets
-            
-            # Convert to past tense for display
-            def to_past_tense(action):
-                if action == "maintain":
-                    return "maintained"
-                elif action == "increase":
-                    return "increased"
-                elif action == "decrease":
-                    return "decreased"
+                # No RPE data, use rep-based analysis
+                if avg_reps < rep_range[0]:
+                    verdict = "⬇️ too heavy"
+                elif avg_reps > rep_range[1]:
+                    verdict = "⬆️ too light"
                 else:
-                    return action
-            
-            # Compare actual vs optimal
-            if optimal_action == "unknown":
-                continue  # Skip if we can't determine optimal action
-            
-            # Evaluate decision quality - be more lenient with "maintain" decisions
-            decision_is_good = False
-            
-            # Evaluate decision quality with comprehensive RPE consideration
-            decision_is_good = False
-            
-            # First, check if the current session's RPE justifies the action taken
-            current_rpe = current.get("peak_rpe")
-            
-            if optimal_action == "decrease" and actual_action == "decreased":
-                decision_is_good = True
-            elif optimal_action == "increase" and actual_action == "increased":
-                decision_is_good = True
-            elif optimal_action == "maintain":
-                # For maintain, check if the action was RPE-justified
-                if actual_action in ["maintained", "increased"]:
-                    decision_is_good = True
-                elif actual_action == "decreased":
-                    # Weight decrease from "optimal" previous session is justified if current RPE is high
-                    if current_rpe and current_rpe >= 9.0:
-                        decision_is_good = True
-                    # Also justified if previous session RPE was actually high
-                    elif previous.get("peak_rpe") and previous.get("peak_rpe") >= 9.0:
-                        decision_is_good = True
-            else:
-                # For other cases, check if current session RPE justifies the action
-                if actual_action == "decreased" and current_rpe and current_rpe >= 9.5:
-                    decision_is_good = True  # Decrease justified by high current RPE
-                elif actual_action == "increased" and current_rpe and current_rpe <= 7.5:
-                    decision_is_good = True  # Increase justified by low current RPE
-                elif actual_action == "maintained":
-                    decision_is_good = True  # Maintaining is generally safe
-            
-            if decision_is_good:
-                good_decisions.append({
-                    "from_date": previous["date"],
-                    "to_date": current["date"],
-                    "action": actual_action,
-                    "weight_change": weight_change,
-                    "verdict": "✅ good decision"
-                })
-            else:
-                missed_opportunities.append({
-                    "from_date": previous["date"],
-                    "to_date": current["date"],
-                    "should_have": optimal_action,
-                    "actually_did": actual_action,
-                    "weight_change": weight_change,
-                    "missed_opportunity": f"should have {to_past_tense(optimal_action)} but {actual_action} instead"
-                })
+                    verdict = "✅ in range"
         
-        # Calculate progression efficiency
-        total_decisions = len(good_decisions) + len(missed_opportunities)
-        efficiency_score = (len(good_decisions) / total_decisions * 100) if total_decisions > 0 else 0
+        sessions_analysis.append({
+            "date": date,
+            "session_ago": i,
+            "avg_weight": avg_weight,
+            "avg_reps": avg_reps,
+            "avg_rpe": avg_rpe,
+            "peak_rpe": peak_rpe,
+            "final_rpe": final_rpe,
+            "total_volume": total_volume,
+            "sets": len(positions),
+            "verdict": verdict
+        })
+    
+    # Analyze decision quality: what actually happened vs what should have happened
+    missed_opportunities = []
+    good_decisions = []
+    
+    # Session fields as columns, read once instead of per record (sessions run newest first)
+    dates = [session["date"] for session in sessions_analysis]
+    avg_weights = [session["avg_weight"] for session in sessions_analysis]
+    peak_rpes = [session["peak_rpe"] for session in sessions_analysis]
+    verdicts = [session["verdict"] for session in sessions_analysis]
+    
+    for i in range(len(sessions_analysis) - 1):
+        weight_change = avg_weights[i] - avg_weights[i + 1]
         
-        evolution_data[exercise] = {
-            "sessions": sessions_analysis,
-            "good_decisions": good_decisions,
-            "missed_opportunities": missed_opportunities,
-            "efficiency_score": efficiency_score,
-            "total_decisions": total_decisions,
-            "absolute_latest_date": absolute_latest_date  # Add reference date
-        }
+        # What actually happened
+        if weight_change > 0.5:
+            actual_action = "increased"
+        elif weight_change < -0.5:
+            actual_action = "decreased"
+        else:
+            actual_action = "maintained"
+        
+        # What should have happened based on previous session's verdict
+        previous_verdict = verdicts[i + 1]
+        if previous_verdict in ["⬇️ too heavy", "⬇️ too heavy (RPE)"]:
+            optimal_action = "decrease"
+        elif previous_verdict in ["⬆️ too light", "⬆️ too light (RPE)"]:
+            optimal_action = "increase"
+        elif previous_verdict in ["✅ optimal", "✅ in range"]:
+            # If previous session was optimal/good, maintaining or small increase is fine
+            optimal_action = "maintain"
+        else:  # "❓ no target"
+            optimal_action = "unknown"
+            continue  # Skip analysis if we don't have targets
+        
+        # Compare actual vs optimal
+        if optimal_action == "unknown":
+            continue  # Skip if we can't determine optimal action
+        
+        # Evaluate decision quality with comprehensive RPE consideration
+        # (more lenient with "maintain" decisions)
+        decision_is_good = False
+        
+        # First, check if the current session's RPE justifies the action taken
+        current_rpe = peak_rpes[i]
+        
+        if optimal_action == "decrease" and actual_action == "decreased":
+            decision_is_good = True
+        elif optimal_action == "increase" and actual_action == "increased":
+            decision_is_good = True
+        elif optimal_action == "maintain":
+            # For maintain, check if the action was RPE-justified
+            if actual_action in ["maintained", "increased"]:
+                decision_is_good = True
+            elif actual_action == "decreased":
+                # Weight decrease from "optimal" previous session is justified if current RPE is high
+                if current_rpe and current_rpe >= 9.0:
+                    decision_is_good = True
+                # Also justified if previous session RPE was actually high
+                elif peak_rpes[i + 1] and peak_rpes[i + 1] >= 9.0:
+                    decision_is_good = True
+        else:
+            # For other cases, check if current session RPE justifies the action
+            if actual_action == "decreased" and current_rpe and current_rpe >= 9.5:
+                decision_is_good = True  # Decrease justified by high current RPE
+            elif actual_action == "increased" and current_rpe and current_rpe <= 7.5:
+                decision_is_good = True  # Increase justified by low current RPE
+            elif actual_action == "maintained":
+                decision_is_good = True  # Maintaining is generally safe
+        
+        if decision_is_good:
+            good_decisions.append({
+                "from_date": dates[i + 1],
+                "to_date": dates[i],
+                "action": actual_action,
+                "weight_change": weight_change,
+                "verdict": "✅ good decision"
+            })
+        else:
+            missed_opportunities.append({
+                "from_date": dates[i + 1],
+                "to_date": dates[i],
+                "should_have": optimal_action,
+                "actually_did": actual_action,
+                "weight_change": weight_change,
+                "missed_opportunity": f"should have {PAST_TENSE_ACTIONS[optimal_action]} but {actual_action} instead"
+            })
+    
+    # Calculate progression efficiency
+    total_decisions = len(good_decisions) + len(missed_opportunities)
+    efficiency_score = (len(good_decisions) / total_decisions * 100) if total_decisions > 0 else 0
+    
+    return {
+        "sessions": sessions_analysis,
+        "good_decisions": good_decisions,
+        "missed_opportunities": missed_opportunities,
+        "efficiency_score": efficiency_score,
+        "total_decisions": total_decisions
+    }
+
+def analyze_exercise_evolution(df: pd.DataFrame) -> Dict:
+    """
+    Analyze the evolution of each exercise over multiple sessions, 
+    providing recommendations for past sessions and identifying missed opportunities.
+    
+    Args:
+        df: DataFrame with workout data
+    
+    Returns:
+        Dictionary with exercise evolution analysis
+    """
+    if len(df) == 0:
+        return {}
+    
+    # Get the absolute latest date across all exercises for reference
+    absolute_latest_date = df["date"].max()
+    
+    # Exercises are analysed in-process from one groupby split; each has only a handful of
+    # sessions, so process pool startup and pickling would cost more than the work itself
+    evolution_data = {}
+    for exercise, exercise_df in df.groupby("exercise", sort=False):
+        exercise_evolution = _analyze_single_exercise_evolution(exercise, exercise_df)
+        if exercise_evolution is None:
+            continue
+        exercise_evolution["absolute_latest_date"] = absolute_latest_date  # Add reference date
+        evolution_data[exercise] = exercise_evolution
     
     return evolution_data
 
@@ -3156,11 +3959,17 @@ def get_comprehensive_trends(df: pd.DataFrame) -> Dict:
     if len(df) == 0:
         return {}
     
-    df_copy = df.copy()
-    df_copy["date"] = pd.to_datetime(df_copy["date"])
-    df_copy["volume"] = df_copy["weight"] * df_copy["reps"]
-    df_copy["week"] = df_copy["date"].dt.isocalendar().week
-    df_copy["day_number"] = (df_copy["date"] - df_copy["date"].min()).dt.days
+    # Only the columns this analysis reads (dates are parsed at ingest), not a full-frame copy
+    dates = pd.to_datetime(df["date"])
+    df_copy = pd.DataFrame({
+        "date": dates,
+        "exercise": df["exercise"],
+        "weight": df["weight"],
+        "reps": df["reps"],
+        "rpe": df["rpe"],
+        "volume": df["weight"] * df["reps"],
+        "week": iso_week_numbers(dates)
+    })
     
     # Weekly volume analysis
     weekly_stats = df_copy.groupby("week").agg({
@@ -3195,96 +4004,75 @@ def get_comprehensive_trends(df: pd.DataFrame) -> Dict:
         if len(week_numbers) > 1:
             slope = (volumes[-1] - volumes[0]) / (week_numbers[-1] - week_numbers[0]) if week_numbers[-1] != week_numbers[0] else 0
             volume_velocity = slope  # kg per week
-            
-            if slope > 500:
-                volume_trend = "rapidly increasing"
-            elif slope > 200:
-                volume_trend = "steadily increasing"
-            elif slope > -200:
-                volume_trend = "stable"
-            elif slope > -500:
-                volume_trend = "declining"
-            else:
-                volume_trend = "rapidly declining"
+            volume_trend = VOLUME_TREND_LABELS[np.searchsorted(VOLUME_TREND_BINS, slope)]
     elif is_current_week_partial:
         volume_trend = "partial week"
         volume_velocity = 0
     
-    # Exercise-specific strength trends
+    # Session-level statistics for every exercise in a single grouped pass
+    session_level = df_copy.groupby(["exercise", "date"]).agg(
+        weight=("weight", "mean"),
+        reps=("reps", "mean"),
+        volume=("volume", "sum"),
+        rpe=("rpe", "mean"),
+        peak_rpe=("rpe", "max")
+    ).sort_index()
+    session_dates = session_level.index.get_level_values("date").to_series(index=session_level.index)
+    per_exercise = session_level.groupby(level="exercise")["weight"].agg(
+        starting_weight="first", current_weight="last", peak_weight="max"
+    )
+    per_exercise["first_date"] = session_dates.groupby(level="exercise").min()
+    per_exercise["last_date"] = session_dates.groupby(level="exercise").max()
+    set_counts = df_copy.groupby("exercise").size().to_dict()
+    
+    # Weekly progression rate for every exercise at once (single-session exercises span 0 days and get 0)
+    days_span = (per_exercise["last_date"] - per_exercise["first_date"]).dt.days.to_numpy()
+    weight_change = (per_exercise["current_weight"] - per_exercise["starting_weight"]).to_numpy()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        exercise_rates = np.where(days_span > 0, weight_change / (days_span / 7), 0.0)
+    
+    # Exercise-specific strength trends (need at least 3 sets), in first-seen order
+    exercise_positions = {exercise: i for i, exercise in enumerate(per_exercise.index)}
+    trend_exercises = [exercise for exercise in df_copy["exercise"].unique() if set_counts[exercise] >= 3]
+    weekly_rates = exercise_rates[[exercise_positions[exercise] for exercise in trend_exercises]]
+    
+    # Session frames for those exercises from one groupby split, instead of label indexing per exercise
+    session_groups = dict(iter(session_level[["weight", "reps", "volume", "rpe"]].groupby(level="exercise", sort=False)))
+    exercise_sessions = {
+        exercise: session_groups[exercise].droplevel("exercise").reset_index() for exercise in trend_exercises
+    }
+    
+    # Classify every exercise's growth in one pass
+    growth_idx = np.searchsorted(GROWTH_BINS, weekly_rates)
+    
     exercise_trends = {}
-    for exercise in df_copy["exercise"].unique():
-        exercise_data = df_copy[df_copy["exercise"] == exercise].copy()
-        exercise_data = exercise_data.sort_values("date")
-        
-        if len(exercise_data) < 3:
-            continue  # Need at least 3 sessions for trend analysis
-        
-        # Get session-level statistics (average weight per session)
-        session_stats = exercise_data.groupby("date").agg({
-            "weight": "mean",
-            "reps": "mean", 
-            "volume": "sum",
-            "rpe": "mean"
-        }).reset_index()
-        session_stats = session_stats.sort_values("date")
-        
-        # Calculate weekly progression rate
-        if len(session_stats) >= 2:
-            days_span = (session_stats["date"].iloc[-1] - session_stats["date"].iloc[0]).days
-            weight_change = session_stats["weight"].iloc[-1] - session_stats["weight"].iloc[0]
-            weekly_rate = (weight_change / (days_span / 7)) if days_span > 0 else 0
-        else:
-            weekly_rate = 0
-        
-        # Enhanced growth classification with RPE context
-        if weekly_rate > 1.0:
-            growth_status = "💪 Strong Growth"
-        elif weekly_rate > 0.3:
-            growth_status = "📈 Steady Growth"
-        elif weekly_rate > -0.3:
-            growth_status = "🔄 Maintaining"
-        elif weekly_rate > -1.0:
-            # Check if the decline is RPE-justified
-            recent_sessions_with_rpe = session_stats.tail(3)
-            high_rpe_detected = False
-            
-            # Check for high RPE in recent sessions
-            for _, session in recent_sessions_with_rpe.iterrows():
-                if session.get("rpe") and not pd.isna(session["rpe"]) and session["rpe"] >= 9.5:
-                    high_rpe_detected = True
-                    break
-            
-            # Also check average RPE trend
-            rpe_values = [rpe for rpe in recent_sessions_with_rpe["rpe"].values if rpe and not pd.isna(rpe)]
-            if rpe_values and sum(rpe_values) / len(rpe_values) >= 9.0:
-                high_rpe_detected = True
-            
-            if high_rpe_detected:
-                growth_status = "✅ Smart Adjustment"
-            else:
-                growth_status = "📉 Slight Decline"
-        else:
-            # For significant declines, also check RPE context
-            recent_sessions_with_rpe = session_stats.tail(3)
-            high_rpe_detected = False
+    for (exercise, session_stats), weekly_rate, idx in zip(exercise_sessions.items(), weekly_rates, growth_idx):
+        growth_status = GROWTH_LABELS[idx]
+        
+        # Enhanced growth classification with RPE context (declines only)
+        recent_sessions = session_stats.tail(3)
+        if idx <= 1:
+            # Any recent session at high RPE, as one array comparison (missing RPEs compare False)
+            rpe_array = recent_sessions["rpe"].to_numpy()
+            high_rpe_detected = bool((rpe_array >= 9.5).any())
             
-            # Check for very high RPE in recent sessions
-            for _, session in recent_sessions_with_rpe.iterrows():
-                if session.get("rpe") and not pd.isna(session["rpe"]) and session["rpe"] >= 9.5:
+            if idx == 1:
+                # Also check average RPE trend over the logged (not missing or 0) values
+                rpe_values = rpe_array[~np.isnan(rpe_array) & (rpe_array != 0)]
+                if rpe_values.size and rpe_values.mean() >= 9.0:
                     high_rpe_detected = True
-                    break
-            
-            if high_rpe_detected:
+                
+                if high_rpe_detected:
+                    growth_status = "✅ Smart Adjustment"
+            elif high_rpe_detected:
                 growth_status = "✅ Smart Deload"
-            else:
-                growth_status = "⚠️ Significant Decline"
         
         exercise_trends[exercise] = {
             "weekly_progression_rate": weekly_rate,
             "growth_status": growth_status,
-            "current_weight": session_stats["weight"].iloc[-1],
-            "peak_weight": session_stats["weight"].max(),
-            "recent_sessions": session_stats.tail(3)  # Last 3 sessions for display
+            "current_weight": per_exercise.at[exercise, "current_weight"],
+            "peak_weight": per_exercise.at[exercise, "peak_weight"],
+            "recent_sessions": recent_sessions  # Last 3 sessions for display
         }
     
     # Overall fitness trajectory
@@ -3298,55 +4086,40 @@ def get_comprehensive_trends(df: pd.DataFrame) -> Dict:
         avg_progression_rate = sum(progression_rates) / len(progression_rates)
         
         # Overall fitness trajectory assessment
-        if avg_progression_rate > 0.3:
-            fitness_trajectory = "🚀 Excellent Progress"
-            trajectory_desc = "Strong upward trend across multiple exercises"
-        elif avg_progression_rate > 0.1:
-            fitness_trajectory = "📈 Good Progress"
-            trajectory_desc = "Steady improvements in most exercises"
-        elif avg_progression_rate > -0.1:
-            fitness_trajectory = "🔄 Maintenance Phase"
-            trajectory_desc = "Stable performance, consider progressive overload"
-        else:
-            fitness_trajectory = "📉 Declining Phase"
-            trajectory_desc = "Consider deload, recovery focus, or program change"
+        fitness_trajectory, trajectory_desc = TRAJECTORY_LABELS[np.searchsorted(TRAJECTORY_BINS, avg_progression_rate)]
     else:
         avg_progression_rate = 0
         fitness_trajectory = "📊 Insufficient Data"
         trajectory_desc = "Need more sessions for trend analysis"
     
     # Enhanced peak performance analysis with RPE context
+    # Peak RPE of each exercise's most recent peak-weight session, from one mask over the session-level frame
+    at_peak = session_level["weight"] == session_level.groupby(level="exercise")["weight"].transform("max")
+    peak_sessions = session_level.loc[at_peak, "peak_rpe"]
+    peak_sessions = peak_sessions[~peak_sessions.index.get_level_values("exercise").duplicated(keep="last")]
+    peak_rpes = dict(zip(peak_sessions.index.get_level_values("exercise"), peak_sessions.array))
+    
     exercise_peaks = {}
     for exercise, data in exercise_trends.items():
-        exercise_data = df_copy[df_copy["exercise"] == exercise].copy()
-        
-        # Get session-level data with RPE information
-        session_stats = exercise_data.groupby("date").agg({
-            "weight": "mean",
-            "rpe": ["mean", "max"]  # Both average and peak RPE per session
-        }).reset_index()
-        session_stats.columns = ["date", "weight", "avg_rpe", "peak_rpe"]
-        session_stats = session_stats.sort_values("date")
+        peak_weight = data["peak_weight"]
+        current_weight = data["current_weight"]
         
-        peak_weight = session_stats["weight"].max()
-        current_weight = session_stats["weight"].iloc[-1]
-        
-        # Find the session where peak weight was achieved
-        peak_session = session_stats[session_stats["weight"] == peak_weight].iloc[-1]  # Most recent peak
-        peak_rpe = peak_session["peak_rpe"] if not pd.isna(peak_session["peak_rpe"]) else None
+        peak_rpe = peak_rpes[exercise]
+        peak_rpe = peak_rpe if peak_rpe == peak_rpe else None
         
         # Distance from peak
         peak_gap = peak_weight - current_weight
         peak_gap_pct = (peak_gap / peak_weight) * 100 if peak_weight > 0 else 0
         
         # RPE-aware peak status assessment
-        if peak_gap_pct <= 2:
+        gap_idx = np.searchsorted(PEAK_GAP_BINS, peak_gap_pct)
+        if gap_idx == 0:
             peak_status = "🏆 At Peak"
             peak_assessment = "at all-time peak!"
-        elif peak_gap_pct <= 5:
+        elif gap_idx == 1:
             peak_status = "🎯 Near Peak"
             peak_assessment = f"{peak_gap:.1f}kg below peak ({peak_gap_pct:.1f}% gap)"
-        elif peak_gap_pct <= 10:
+        elif gap_idx == 2:
             # Check if the peak was achieved at unsustainable RPE
             if peak_rpe and peak_rpe >= 9.5:
                 peak_status = "✅ Smart Adjustment"
@@ -3517,6 +4290,10 @@ def main():
                        help="Send report via email (requires email environment variables)")
     parser.add_argument("--test-email", action="store_true",
                        help="Test email configuration without generating report")
+    parser.add_argument("--no-cache", action="store_true",
+                       help="Always recompute analyses and request fresh AI coaching insights instead of reusing cached ones")
+    parser.add_argument("--refresh-routines", action="store_true",
+                       help="Re-fetch routine templates from Hevy instead of using the hourly cache")
     
     args = parser.parse_args()
     
@@ -3527,11 +4304,11 @@ def main():
     
     # Test email configuration if requested
     if args.test_email:
-        email_sender = EmailSender()
-        if email_sender.test_connection():
-            print("🎉 Email configuration is working!")
-        else:
-            print("❌ Email configuration failed. Check environment variables.")
+        with get_email_sender() as email_sender:
+            if email_sender.test_connection():
+                print("🎉 Email configuration is working!")
+            else:
+                print("❌ Email configuration failed. Check environment variables.")
         return
     
     print(f"🎯 Running in '{args.mode}' mode...")
@@ -3597,11 +4374,14 @@ def main():
             return
         
         # Full analysis mode (analyze or both)
-        # Print comprehensive coaching report
-        print_comprehensive_report(df)
+        # Generate the coaching report once; the same text is printed, saved and emailed
+        report_content = capture_comprehensive_report(
+            df, use_cache=not args.no_cache, refresh_routines=args.refresh_routines
+        )
+        print(report_content, end="")
         
         # Auto-save to markdown
-        markdown_file = save_report_to_markdown(df)
+        markdown_file = save_report_to_markdown(df, report_content)
         print(f"\n📝 Report automatically saved to {markdown_file}")
         
         # Auto-export recent workouts to CSV
@@ -3610,20 +4390,13 @@ def main():
         # Optional email sending
         if args.email:
             print(f"\n📧 Sending email...")
-            email_sender = EmailSender()
+            email_sender = get_email_sender()
             
-            # Capture report content for email
-            import io
-            from contextlib import redirect_stdout
-            
-            report_content = io.StringIO()
-            with redirect_stdout(report_content):
-                print_comprehensive_report(df)
-            
-            success = email_sender.send_report(
-                report_content.getvalue(), 
-                markdown_file
-            )
+            with email_sender:
+                success = email_sender.send_report(
+                    report_content, 
+                    markdown_file
+                )
             
             if not success:
                 print("💡 Tip: Set EMAIL_USER and EMAIL_PASSWORD environment variables for email functionality")